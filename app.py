@@ -8,6 +8,8 @@ from pathlib import Path
 import os
 import datetime
 import random
+import functools
+from typing import Optional, Tuple
 
 # ページ設定（必ず最初のStreamlitコマンドとして実行）
 st.set_page_config(
@@ -28,7 +30,33 @@ from modules.models import (
 )
 
 
-# 環境判別
+# 既定の問題タイプ（列挙型の属性参照を毎回行わないよう定数化）
+DEFAULT_QUESTION_TYPE = QuestionType.LOWER_MATCH.value
+
+# サイドバーの選択肢定義（再実行ごとに作り直さないようモジュールレベルで定義）
+APP_MODES = ["🏠 ホーム", "🎯 クイズ", "🔊 音声ライブラリ"]
+
+MODE_OPTIONS = {
+    "sequential": "順番モード（1番から順に）",
+    "random": "ランダムモード"
+}
+
+QUESTION_TYPE_OPTIONS = {
+    QuestionType.LOWER_MATCH.value: "下の句当て",
+    QuestionType.UPPER_MATCH.value: "上の句当て",
+    QuestionType.AUTHOR_MATCH.value: "作者当て",
+    QuestionType.POEM_BY_AUTHOR.value: "作者から歌当て"
+}
+
+
+# 部分再実行（fragment）に対応したStreamlitでのみ有効化する（未対応なら何もしない）
+fragment = (getattr(st, "fragment", None)
+            or getattr(st, "experimental_fragment", None)
+            or (lambda func: func))
+
+
+# 環境判別（プロセス中に変化しないため一度だけ判定する）
+@functools.lru_cache(maxsize=1)
 def get_environment():
     """現在の環境（ブランチ）を取得"""
     # Streamlit CloudのSecretsから取得を試みる
@@ -43,17 +71,23 @@ def get_environment():
     return branch
 
 
+@st.cache_resource
+def get_data_loader() -> DataLoader:
+    """データローダーを取得（プロセス内で全セッション共有）"""
+    return DataLoader()
+
+
 def init_session_state():
     """セッション状態の初期化"""
     if 'initialized' not in st.session_state:
         # データローダーとクイズマネージャーの初期化
-        st.session_state.data_loader = DataLoader()
+        st.session_state.data_loader = get_data_loader()
         st.session_state.quiz_manager = QuizManager(st.session_state.data_loader)
         
         # クイズ設定の初期化
         st.session_state.quiz_config = QuizConfig(
             quiz_mode=QuizMode.SEQUENTIAL,
-            question_types=[QuestionType.LOWER_MATCH.value],
+            question_types=[DEFAULT_QUESTION_TYPE],
             max_questions=100
         )
         
@@ -87,8 +121,8 @@ def create_sidebar():
         st.markdown("### 📱 メニュー")
         app_mode = st.radio(
             "機能を選択",
-            ["🏠 ホーム", "🎯 クイズ", "🔊 音声ライブラリ"],
-            index=["🏠 ホーム", "🎯 クイズ", "🔊 音声ライブラリ"].index(
+            APP_MODES,
+            index=APP_MODES.index(
                 f"🎯 クイズ" if st.session_state.quiz_session else st.session_state.get('app_mode', '🏠 ホーム')
             ),
             key="mode_selector"
@@ -113,14 +147,10 @@ def create_sidebar():
             
             # 出題モード選択
             st.subheader("🔍 出題モード")
-            mode_options = {
-                "sequential": "順番モード（1番から順に）",
-                "random": "ランダムモード"
-            }
             selected_mode = st.radio(
                 "出題順序を選択",
-                options=list(mode_options.keys()),
-                format_func=lambda x: mode_options[x],
+                options=list(MODE_OPTIONS),
+                format_func=MODE_OPTIONS.__getitem__,
                 index=0 if st.session_state.quiz_config.quiz_mode == QuizMode.SEQUENTIAL else 1,
                 disabled=quiz_started,
                 help="クイズ開始後は変更できません"
@@ -128,18 +158,11 @@ def create_sidebar():
             
             # 問題タイプ選択
             st.subheader("❓ 問題タイプ")
-            question_type_options = {
-                QuestionType.LOWER_MATCH.value: "下の句当て",
-                QuestionType.UPPER_MATCH.value: "上の句当て",
-                QuestionType.AUTHOR_MATCH.value: "作者当て",
-                QuestionType.POEM_BY_AUTHOR.value: "作者から歌当て"
-            }
-            
             selected_types = st.multiselect(
                 "出題する問題タイプを選択（複数可）",
-                options=list(question_type_options.keys()),
-                default=[QuestionType.LOWER_MATCH.value],
-                format_func=lambda x: question_type_options[x],
+                options=list(QUESTION_TYPE_OPTIONS),
+                default=[DEFAULT_QUESTION_TYPE],
+                format_func=QUESTION_TYPE_OPTIONS.__getitem__,
                 disabled=quiz_started,
                 help="複数選択すると、ランダムに出題されます"
             )
@@ -159,7 +182,7 @@ def create_sidebar():
             # 設定を更新
             if not quiz_started:
                 st.session_state.quiz_config.quiz_mode = QuizMode(selected_mode)
-                st.session_state.quiz_config.question_types = selected_types if selected_types else [QuestionType.LOWER_MATCH.value]
+                st.session_state.quiz_config.question_types = selected_types if selected_types else [DEFAULT_QUESTION_TYPE]
                 st.session_state.quiz_config.max_questions = max_questions
             
             st.divider()
@@ -169,12 +192,12 @@ def create_sidebar():
             
             col1, col2 = st.columns(2)
             with col1:
-                if st.button(
+                st.button(
                     "🚀 開始" if not quiz_started else "🔄 リセット",
                     type="primary" if not quiz_started else "secondary",
-                    use_container_width=True
-                ):
-                    start_or_reset_quiz()
+                    use_container_width=True,
+                    on_click=start_or_reset_quiz
+                )
             
             with col2:
                 if st.button("📊 統計", use_container_width=True, disabled=not quiz_started):
@@ -186,18 +209,16 @@ def create_sidebar():
                 st.subheader("📈 進捗状況")
                 
                 session = st.session_state.quiz_session
-                # questionsリストの長さから実際の進捗を計算
-                current_num = len(session.questions)
-                progress = session.total_answered / session.max_questions if session.total_answered > 0 else 0
+                current_num, answered, accuracy = get_session_summary(session)
+                progress = answered / session.max_questions
                 
                 st.progress(min(progress, 1.0))
                 st.write(f"問題: {current_num}/{session.max_questions}")
-                st.write(f"回答済み: {session.total_answered}問")
+                st.write(f"回答済み: {answered}問")
                 st.write(f"{session.get_score_text()}")
                 
                 # 統計情報
-                if session.total_answered > 0:
-                    accuracy = (session.score / session.total_answered) * 100
+                if accuracy is not None:
                     if accuracy >= 80:
                         st.success(f"正答率: {accuracy:.1f}% 🎉")
                     elif accuracy >= 60:
@@ -206,8 +227,22 @@ def create_sidebar():
                         st.warning(f"正答率: {accuracy:.1f}% 💪")
 
 
+def get_session_summary(session: QuizSession) -> Tuple[int, int, Optional[float]]:
+    """
+    進捗表示用の値をまとめて計算する
+    
+    Returns:
+        （問題番号, 回答済み数, 正答率）のタプル。未回答の場合、正答率はNone
+    """
+    # questionsリストの長さから実際の進捗を計算
+    current_num = len(session.questions)
+    answered = session.total_answered
+    accuracy = (session.score / answered) * 100 if answered > 0 else None
+    return current_num, answered, accuracy
+
+
 def start_or_reset_quiz():
-    """クイズを開始またはリセット"""
+    """クイズを開始またはリセット（ボタンのコールバック）"""
     # 最終結果表示フラグをリセット
     st.session_state.show_final_results = False
     
@@ -226,9 +261,6 @@ def start_or_reset_quiz():
     st.session_state.selected_answer = None
     st.session_state.is_answered = False
     st.session_state.show_explanation = False
-    
-    # ページを再描画
-    st.rerun()
 
 
 def show_statistics():
@@ -362,27 +394,28 @@ def display_audio_library():
         else:
             poem_ids = sorted(available_audio.keys())
         
-        # 歌を表示
+        # 歌を表示（ローダーの索引を直接引く）
+        get_poem = st.session_state.data_loader.get_poem_by_id
         for poem_id in poem_ids:
-            poem = st.session_state.data_loader.get_poem_by_id(poem_id)
+            poem = get_poem(poem_id)
             if poem:
                 # 音声が利用可能な場合
                 if poem_id in available_audio:
                     # 上の句の最初の部分を取得（表示用）
-                    upper_preview = poem['upper'][:15] + "..." if len(poem['upper']) > 15 else poem['upper']
-                    with st.expander(f"🔊 第{poem_id}首 - {poem['author']} 「{upper_preview}」", expanded=False):
+                    upper_preview = poem.upper[:15] + "..." if len(poem.upper) > 15 else poem.upper
+                    with st.expander(f"🔊 第{poem_id}首 - {poem.author} 「{upper_preview}」", expanded=False):
                         # 歌の内容
                         col1, col2 = st.columns([3, 1])
                         
                         with col1:
-                            st.markdown(f"**{poem['upper']}**")
-                            st.markdown(f"**{poem['lower']}**")
+                            st.markdown(f"**{poem.upper}**")
+                            st.markdown(f"**{poem.lower}**")
                             
                             # 読み仮名
-                            if 'reading_upper' in poem and poem['reading_upper']:
+                            if poem.reading_upper:
                                 st.caption("読み：")
-                                st.caption(f"{poem['reading_upper']}")
-                                st.caption(f"{poem['reading_lower']}")
+                                st.caption(f"{poem.reading_upper}")
+                                st.caption(f"{poem.reading_lower}")
                         
                         with col2:
                             st.write("")  # スペース調整
@@ -394,23 +427,45 @@ def display_audio_library():
                         st.audio(audio_bytes, format="audio/mp3")
                         
                         # 解説
-                        if 'description' in poem and poem['description']:
+                        if poem.description:
                             with st.container():
                                 st.markdown("**📖 解説**")
-                                st.write(poem['description'])
+                                st.write(poem.description)
                 
                 # 音声が利用できない場合（show_all=Trueの時のみ）
                 else:
                     # 上の句の最初の部分を取得（表示用）
-                    upper_preview = poem['upper'][:15] + "..." if len(poem['upper']) > 15 else poem['upper']
-                    with st.expander(f"第{poem_id}首 - {poem['author']} 「{upper_preview}」 (音声なし)", expanded=False):
-                        st.markdown(f"**{poem['upper']}**")
-                        st.markdown(f"**{poem['lower']}**")
+                    upper_preview = poem.upper[:15] + "..." if len(poem.upper) > 15 else poem.upper
+                    with st.expander(f"第{poem_id}首 - {poem.author} 「{upper_preview}」 (音声なし)", expanded=False):
+                        st.markdown(f"**{poem.upper}**")
+                        st.markdown(f"**{poem.lower}**")
                         st.info("🔇 この歌の音声はまだ利用できません")
     else:
         st.warning("音声ファイルが見つかりません。dataフォルダに音声ファイル（1.mp3〜100.mp3）を配置してください。")
 
 
+def reset_viewed_poems():
+    """閲覧履歴をリセットする（ボタンのコールバック）"""
+    st.session_state.viewed_poem_ids = set()
+    st.session_state.todays_poem_id = random.randint(1, 100)
+
+
+def show_another_poem():
+    """まだ見ていない歌から次の一首を選ぶ（ボタンのコールバック）"""
+    available_ids = list(set(range(1, 101)) - st.session_state.viewed_poem_ids)
+    if available_ids:
+        new_poem_id = random.choice(available_ids)
+        st.session_state.todays_poem_id = new_poem_id
+        st.session_state.viewed_poem_ids.add(new_poem_id)
+
+
+@st.cache_data(ttl=86400)
+def get_todays_poem_id(date_iso: str) -> int:
+    """日付から今日の一首のIDを決定する（同じ日付なら常に同じ歌）"""
+    rng = random.Random(int(date_iso.replace('-', '')))
+    return rng.randint(1, 100)
+
+
 def display_welcome_screen():
     """ウェルカム画面の表示"""
     st.markdown("""
@@ -444,18 +499,13 @@ def display_welcome_screen():
     st.subheader("📖 今日の一首")
     
     # 日付ベースでランダムに選択（毎日異なる歌を表示）
-    today = datetime.date.today()
-    seed = int(today.strftime("%Y%m%d"))
-    random.seed(seed)
-    poem_id = random.randint(1, 100)
-    
     # セッション状態で管理（リロードしても同じ歌を表示）
     if 'todays_poem_id' not in st.session_state:
-        st.session_state.todays_poem_id = poem_id
+        st.session_state.todays_poem_id = get_todays_poem_id(datetime.date.today().isoformat())
     
-    # 閲覧履歴を管理（オプション）
+    # 閲覧履歴を管理（オプション、重複なしのセットで保持）
     if 'viewed_poem_ids' not in st.session_state:
-        st.session_state.viewed_poem_ids = [st.session_state.todays_poem_id]
+        st.session_state.viewed_poem_ids = {st.session_state.todays_poem_id}
     
     sample_poem = st.session_state.data_loader.get_poem_by_id(st.session_state.todays_poem_id)
     
@@ -463,65 +513,54 @@ def display_welcome_screen():
         col1, col2 = st.columns([2, 1])
         with col1:
             st.info(f"""
-            **第{sample_poem['id']}首**
+            **第{sample_poem.id}首**
             
-            {sample_poem['upper']}  
-            　　{sample_poem['lower']}
+            {sample_poem.upper}  
+            　　{sample_poem.lower}
             
-            **作者**: {sample_poem['author']}
+            **作者**: {sample_poem.author}
             """)
         
         with col2:
-            if 'reading_upper' in sample_poem:
+            if sample_poem.reading_upper:
                 st.caption("読み")
-                st.caption(f"{sample_poem['reading_upper']}")
-                st.caption(f"{sample_poem['reading_lower']}")
+                st.caption(f"{sample_poem.reading_upper}")
+                st.caption(f"{sample_poem.reading_lower}")
             
             # リロードボタン（新しい歌を表示）
-            remaining_poems = 100 - len(set(st.session_state.viewed_poem_ids))
+            remaining_poems = 100 - len(st.session_state.viewed_poem_ids)
             button_label = f"🔄 別の歌を見る (残り{remaining_poems}首)"
             
             # 全ての歌を見た場合はリセット
             if remaining_poems <= 0:
-                if st.button("🔄 最初から見る", key="reset_poems"):
-                    st.session_state.viewed_poem_ids = []
-                    st.session_state.todays_poem_id = random.randint(1, 100)
-                    st.rerun()
+                st.button("🔄 最初から見る", key="reset_poems", on_click=reset_viewed_poems)
             else:
-                if st.button(button_label, key="reload_poem"):
-                    # まだ見ていない歌から選択
-                    available_ids = [i for i in range(1, 101) if i not in st.session_state.viewed_poem_ids]
-                    if available_ids:
-                        new_poem_id = random.choice(available_ids)
-                        st.session_state.todays_poem_id = new_poem_id
-                        st.session_state.viewed_poem_ids.append(new_poem_id)
-                        st.rerun()
+                st.button(button_label, key="reload_poem", on_click=show_another_poem)
             
             # 閲覧進捗の表示
-            st.caption(f"閲覧済み: {len(set(st.session_state.viewed_poem_ids))}/100首")
+            st.caption(f"閲覧済み: {len(st.session_state.viewed_poem_ids)}/100首")
 
 
+@fragment
 def display_quiz_screen():
-    """クイズ画面の表示"""
+    """クイズ画面の表示（選択肢の操作ではこの画面のみ再実行）"""
     if st.session_state.current_question is None:
         st.error("問題の生成に失敗しました")
         return
     
     question = st.session_state.current_question
     session = st.session_state.quiz_session
+    current_num, _, accuracy = get_session_summary(session)
     
     # 問題番号と進捗
     col1, col2, col3 = st.columns([2, 1, 1])
     with col1:
-        # 実際の問題番号を表示（questionsリストの長さから取得）
-        current_num = len(session.questions)
         st.subheader(f"問題 {current_num}/{session.max_questions}")
     with col2:
         pattern = QUESTION_PATTERNS[question.question_type]
         st.info(f"🔍 {pattern['display_name']}")
     with col3:
-        if session.total_answered > 0:
-            accuracy = (session.score / session.total_answered) * 100
+        if accuracy is not None:
             st.metric("正答率", f"{accuracy:.0f}%")
         else:
             st.metric("正答率", "-%")
@@ -567,7 +606,7 @@ def display_quiz_screen():
     with col2:
         if st.session_state.is_answered:
             # 最後の問題かチェック（生成済み問題数で判断）
-            is_last = len(session.questions) >= session.max_questions
+            is_last = current_num >= session.max_questions
             
             if not is_last:
                 if st.button("➡️ 次の問題", type="primary", use_container_width=True):
@@ -596,15 +635,9 @@ def submit_answer():
     session = st.session_state.quiz_session
     question = st.session_state.current_question
     
-    # 回答を記録
+    # 回答を記録して正誤判定（セッションの統計情報も更新される）
     st.session_state.is_answered = True
-    session.is_answered = True
-    session.total_answered += 1
-    
-    # 正誤判定
-    is_correct = question.check_answer(st.session_state.selected_answer)
-    if is_correct:
-        session.score += 1
+    is_correct = session.submit_answer(st.session_state.selected_answer)
     
     # 回答履歴に記録（新しいセッションの場合のみ）
     if hasattr(session, 'record_answer'):
@@ -643,15 +676,13 @@ def next_question():
     
     if question:
         st.session_state.current_question = question
-        # インデックスを進める
-        session.current_question_index = len(session.questions) - 1
+        # インデックスを進める（セッションの回答状態もリセットされる）
+        session.next_question()
         
-        # 回答状態をリセット（セッション全体のフラグもリセット）
+        # 回答状態をリセット
         st.session_state.selected_answer = None
         st.session_state.is_answered = False
         st.session_state.show_explanation = False
-        session.is_answered = False  # セッションのフラグもリセット
-        session.current_answer = None
         
         # ページを再描画
         st.rerun()
@@ -697,7 +728,8 @@ def show_detailed_statistics():
         
         # セッション情報
         st.markdown("#### セッション情報")
-        st.write(f"- 使用した問題ID: {session.used_poem_ids[:10]}..." if len(session.used_poem_ids) > 10 else f"- 使用した問題ID: {session.used_poem_ids}")
+        used_poem_ids = list(session.used_poem_ids)
+        st.write(f"- 使用した問題ID: {used_poem_ids[:10]}..." if len(used_poem_ids) > 10 else f"- 使用した問題ID: {used_poem_ids}")
         st.write(f"- 出題モード: {'順番' if session.quiz_mode == QuizMode.SEQUENTIAL else 'ランダム'}")
 
 
@@ -747,25 +779,36 @@ def show_incorrect_questions():
             col1, col2 = st.columns([2, 1])
             with col1:
                 st.info(f"""
-                **第{poem['id']}首**
+                **第{poem.id}首**
                 
-                {poem['upper']}  
-                　　{poem['lower']}
+                {poem.upper}  
+                　　{poem.lower}
                 
-                **作者**: {poem['author']}
+                **作者**: {poem.author}
                 """)
             
             with col2:
-                if 'reading_upper' in poem and poem['reading_upper']:
+                if poem.reading_upper:
                     st.caption("読み")
-                    st.caption(f"{poem['reading_upper']}")
-                    st.caption(f"{poem['reading_lower']}")
+                    st.caption(f"{poem.reading_upper}")
+                    st.caption(f"{poem.reading_lower}")
             
             # 解説があれば表示（expanderを使わず直接表示）
-            if 'description' in poem and poem['description']:
+            if poem.description:
                 st.divider()
                 st.markdown("**📚 解説:**")
-                st.write(poem['description'])
+                st.write(poem.description)
+
+
+def clear_quiz_session():
+    """セッションをクリアして初期画面に戻る（ボタンのコールバック）"""
+    # 最終結果表示フラグをリセット
+    st.session_state.show_final_results = False
+    st.session_state.quiz_session = None
+    st.session_state.current_question = None
+    st.session_state.selected_answer = None
+    st.session_state.is_answered = False
+    st.session_state.show_explanation = False
 
 
 def show_final_results():
@@ -802,23 +845,12 @@ def show_final_results():
     
     col1, col2, col3 = st.columns(3)
     with col1:
-        if st.button("🔄 もう一度同じ設定で", type="primary", use_container_width=True):
-            # 最終結果表示フラグをリセット
-            st.session_state.show_final_results = False
-            # 同じ設定で新しいクイズを開始
-            start_or_reset_quiz()
+        # 同じ設定で新しいクイズを開始
+        st.button("🔄 もう一度同じ設定で", type="primary", use_container_width=True,
+                  on_click=start_or_reset_quiz)
     
     with col2:
-        if st.button("⚙️ 設定を変更する", use_container_width=True):
-            # 最終結果表示フラグをリセット
-            st.session_state.show_final_results = False
-            # セッションをクリアして初期画面に戻る
-            st.session_state.quiz_session = None
-            st.session_state.current_question = None
-            st.session_state.selected_answer = None
-            st.session_state.is_answered = False
-            st.session_state.show_explanation = False
-            st.rerun()
+        st.button("⚙️ 設定を変更する", use_container_width=True, on_click=clear_quiz_session)
     
     with col3:
         if st.button("📊 詳細な統計を見る", use_container_width=True):
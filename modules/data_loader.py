@@ -3,37 +3,74 @@
 """
 import json
 import os
-from typing import List, Dict, Optional
+import random
+import sys
+from collections import defaultdict
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+# プロジェクトルートをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# JSONのパーサーはmodelsと共通のもの（orjsonが利用可能なら高速なパーサー）を使用する
+from modules.models import Poem, _json_loads
+
+# 既定のデータファイル（modules/poems_data.py はこのファイルから生成される）
+DEFAULT_JSON_PATH = "data/hyakunin_isshu.json"
+
+# 検証済みのJSONファイル（パス, 更新時刻, サイズ）。変更のないファイルは再検証しない
+_validated_files = set()
+
 
 class DataLoader:
     """百人一首データの読み込みと管理を行うクラス"""
     
-    def __init__(self, json_path: str = "data/hyakunin_isshu.json"):
+    def __init__(self, json_path: str = DEFAULT_JSON_PATH, use_prebuilt: bool = True):
         """
         初期化
         
         Args:
             json_path: JSONファイルのパス
+            use_prebuilt: 既定のデータファイルの場合、生成済みのPythonモジュールを使用する
         """
         self.json_path = json_path
-        self.data: List[Dict] = []
+        self.use_prebuilt = use_prebuilt
+        self.data: List[Poem] = []
+        self._by_id: Dict[int, Poem] = {}
+        self._by_author: Dict[str, List[Poem]] = {}
+        self._authors: List[str] = []
         self._load_and_validate_data()
     
     def _load_and_validate_data(self) -> None:
         """JSONファイルを読み込み、データを検証する"""
+        # 生成済みモジュールがあればJSONの読み込みと検証を省略する
+        if self.use_prebuilt and self.json_path == DEFAULT_JSON_PATH:
+            poems = _load_prebuilt_poems()
+            if poems is not None:
+                self.data = list(poems)
+                self._build_indexes()
+                return
+        
         try:
             # ファイルの存在確認
             if not os.path.exists(self.json_path):
                 raise FileNotFoundError(f"データファイルが見つかりません: {self.json_path}")
             
-            # JSONファイルの読み込み
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
+            # JSONファイルの読み込み（一括でバイト列として読み込む）
+            self.data = _json_loads(Path(self.json_path).read_bytes())
             
-            # データ検証
-            self._validate_data()
+            # データ検証（前回から変更のないファイルは省略）
+            stat = os.stat(self.json_path)
+            file_key = (os.path.abspath(self.json_path), stat.st_mtime_ns, stat.st_size)
+            if file_key not in _validated_files:
+                self._validate_data()
+                _validated_files.add(file_key)
+            
+            # 検証済みのデータを不変のPoemに変換
+            self.data = [Poem.from_dict(poem) for poem in self.data]
+            
+            # 検索用インデックスの構築
+            self._build_indexes()
             
         except FileNotFoundError as e:
             raise FileNotFoundError(f"データファイルの読み込みエラー: {e}")
@@ -56,7 +93,16 @@ class DataLoader:
         if len(self.data) != 100:
             print(f"警告: データ数が100首ではありません（{len(self.data)}首）")
         
-        # 各歌のデータ検証
+        # 高速チェック：全ての歌が妥当であれば詳細な検証を省略する
+        if all(
+            isinstance(poem, dict)
+            and all(poem.get(field) for field in required_fields)
+            and isinstance(poem['id'], int) and 1 <= poem['id'] <= 100
+            for poem in self.data
+        ):
+            return
+        
+        # 各歌のデータ検証（エラー箇所の特定）
         for i, poem in enumerate(self.data):
             if not isinstance(poem, dict):
                 raise ValueError(f"データ[{i}]が辞書形式ではありません")
@@ -72,16 +118,25 @@ class DataLoader:
             if not isinstance(poem['id'], int) or poem['id'] < 1 or poem['id'] > 100:
                 raise ValueError(f"データ[{i}]のIDが不正です: {poem.get('id')}")
     
-    def load_data(self) -> List[Dict]:
+    def _build_indexes(self) -> None:
+        """IDと作者による検索用インデックスを構築する"""
+        self._by_id = {poem.id: poem for poem in self.data}
+        by_author = defaultdict(list)
+        for poem in self.data:
+            by_author[poem.author].append(poem)
+        self._by_author = dict(by_author)
+        self._authors = sorted(self._by_author)
+    
+    def load_data(self) -> List[Poem]:
         """
         データを取得する
         
         Returns:
-            百人一首データのリスト
+            百人一首データのリスト（読み取り専用として扱うこと）
         """
-        return self.data.copy()
+        return self.data
     
-    def get_poem_by_id(self, poem_id: int) -> Optional[Dict]:
+    def get_poem_by_id(self, poem_id: int) -> Optional[Poem]:
         """
         指定されたIDの歌を取得する
         
@@ -89,21 +144,18 @@ class DataLoader:
             poem_id: 歌のID（1-100）
         
         Returns:
-            歌のデータ（辞書）、見つからない場合はNone
+            歌のデータ、見つからない場合はNone
         """
-        for poem in self.data:
-            if poem['id'] == poem_id:
-                return poem.copy()
-        return None
+        return self._by_id.get(poem_id)
     
-    def get_all_poems(self) -> List[Dict]:
+    def get_all_poems(self) -> List[Poem]:
         """
         全ての歌を取得する
         
         Returns:
-            全ての歌のリスト
+            全ての歌のリスト（読み取り専用として扱うこと）
         """
-        return self.data.copy()
+        return self.data
     
     def get_poem_count(self) -> int:
         """
@@ -114,7 +166,7 @@ class DataLoader:
         """
         return len(self.data)
     
-    def get_random_poems(self, count: int, exclude_id: Optional[int] = None) -> List[Dict]:
+    def get_random_poems(self, count: int, exclude_id: Optional[int] = None) -> List[Poem]:
         """
         ランダムに歌を取得する
         
@@ -125,28 +177,34 @@ class DataLoader:
         Returns:
             ランダムに選ばれた歌のリスト
         """
-        import random
-        
-        available_poems = [
-            poem for poem in self.data 
-            if exclude_id is None or poem['id'] != exclude_id
-        ]
-        
-        if count > len(available_poems):
-            count = len(available_poems)
-        
-        return random.sample(available_poems, count)
+        poem_total = len(self.data)
+        
+        # 除外対象がない場合はインデックスから直接選ぶ
+        if exclude_id not in self._by_id:
+            count = min(count, poem_total)
+            return [self.data[i] for i in random.sample(range(poem_total), count)]
+        
+        # 1首多く選び、除外対象（含まれなければ末尾）を取り除く
+        count = min(count, poem_total - 1)
+        selected = [self.data[i] for i in random.sample(range(poem_total), count + 1)]
+        for i, poem in enumerate(selected):
+            if poem.id == exclude_id:
+                del selected[i]
+                break
+        else:
+            selected.pop()
+        return selected
     
     def get_authors(self) -> List[str]:
         """
         全ての作者名を取得する
         
         Returns:
-            作者名のリスト（重複なし）
+            作者名のリスト（重複なし、ソート済み）
         """
-        return list(set(poem['author'] for poem in self.data))
+        return self._authors
     
-    def get_poems_by_author(self, author: str) -> List[Dict]:
+    def get_poems_by_author(self, author: str) -> List[Poem]:
         """
         指定された作者の歌を取得する
         
@@ -154,9 +212,23 @@ class DataLoader:
             author: 作者名
         
         Returns:
-            該当する歌のリスト
+            該当する歌のリスト（読み取り専用として扱うこと）
         """
-        return [poem.copy() for poem in self.data if poem['author'] == author]
+        return self._by_author.get(author, [])
+
+
+def _load_prebuilt_poems() -> Optional[Tuple[Poem, ...]]:
+    """
+    tools/gen_poems.py で生成した検証済みの歌データを取得する
+    
+    Returns:
+        歌データのタプル、生成されていない場合はNone
+    """
+    try:
+        from modules.poems_data import POEMS
+    except ImportError:
+        return None
+    return POEMS
 
 
 # テスト用のメイン処理
@@ -1,9 +1,29 @@
 """
 百人一首クイズアプリケーションのデータモデル定義
 """
-from typing import List, Dict, Optional, Literal
+import json
+import sys
+from typing import List, Dict, Optional, Literal, NamedTuple, Any, Set, Tuple
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
+from types import MappingProxyType
+
+
+# orjsonが利用可能なら高速なシリアライザー・パーサーを使用する（標準のjsonにフォールバック）
+# data_loaderもここで定義した_json_loadsを使うため、フォールバックはこの一箇所で管理する
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    _json_loads = json.loads
+
+# Python 3.10以降ではdataclassに__slots__を付けてメモリ使用量と属性アクセスを軽くする
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class QuizMode(Enum):
@@ -20,55 +40,95 @@ class QuestionType(Enum):
     POEM_BY_AUTHOR = "poem_by_author"  # 作者から歌当て
 
 
-# 問題パターンの定義
-QUESTION_PATTERNS = {
+# 問題パターンの定義（formatterは"question"テンプレートを事前に展開した問題文生成関数、Poemを受け取る）
+# 定数テーブルは誤って書き換えないよう読み取り専用にする
+QUESTION_PATTERNS = MappingProxyType({
     QuestionType.LOWER_MATCH.value: {
         "question": "次の上の句に続く下の句を選んでください：\n「{upper}」",
+        "formatter": lambda p: f"次の上の句に続く下の句を選んでください：\n「{p.upper}」",
         "correct_field": "lower",
         "display_name": "下の句当て",
         "instruction": "上の句から正しい下の句を選択"
     },
     QuestionType.UPPER_MATCH.value: {
         "question": "次の下の句に対応する上の句を選んでください：\n「{lower}」",
+        "formatter": lambda p: f"次の下の句に対応する上の句を選んでください：\n「{p.lower}」",
         "correct_field": "upper",
         "display_name": "上の句当て",
         "instruction": "下の句から正しい上の句を選択"
     },
     QuestionType.AUTHOR_MATCH.value: {
         "question": "次の歌の作者を選んでください：\n「{upper}」\n「{lower}」",
+        "formatter": lambda p: f"次の歌の作者を選んでください：\n「{p.upper}」\n「{p.lower}」",
         "correct_field": "author",
         "display_name": "作者当て",
         "instruction": "歌から正しい作者を選択"
     },
     QuestionType.POEM_BY_AUTHOR.value: {
         "question": "『{author}』の歌の下の句を選んでください",
+        "formatter": lambda p: f"『{p.author}』の歌の下の句を選んでください",
         "correct_field": "lower",
         "display_name": "作者から歌当て",
         "instruction": "作者から正しい歌を選択"
     }
-}
+})
 
 
 # UIカラー定義
-COLORS = {
+COLORS = MappingProxyType({
     "correct": "#4CAF50",      # 正解時の緑
     "incorrect": "#f44336",    # 不正解時の赤
     "selected": "#2196F3",     # 選択時の青
     "default": "#ffffff",      # デフォルト白
     "disabled": "#cccccc",     # 無効時のグレー
     "highlight": "#FFC107"     # ハイライト黄
-}
+})
+
+
+class Poem(NamedTuple):
+    """歌データクラス（読み込み後は変更しない）"""
+    id: int                   # 歌番号（1-100）
+    author: str               # 作者
+    upper: str                # 上の句
+    lower: str                # 下の句
+    reading_upper: str = ""   # 上の句の読み
+    reading_lower: str = ""   # 下の句の読み
+    description: str = ""     # 解説
+    
+    def __getitem__(self, key):
+        """poem['author'] のような辞書形式のアクセスにも対応（外部との互換用、内部では属性アクセスを使う）"""
+        if isinstance(key, str):
+            try:
+                return tuple.__getitem__(self, _POEM_FIELD_INDEX[key])
+            except KeyError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """辞書のgetと同様に値を取得"""
+        index = _POEM_FIELD_INDEX.get(key)
+        if index is None:
+            return default
+        return tuple.__getitem__(self, index)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Poem':
+        """辞書から生成（未知の項目は無視する）"""
+        return cls(**{name: data[name] for name in cls._fields if name in data})
+
 
+# 項目名から位置への対応表
+_POEM_FIELD_INDEX = {name: i for i, name in enumerate(Poem._fields)}
 
-@dataclass
-class Question:
-    """問題クラス"""
+
+class Question(NamedTuple):
+    """問題クラス（生成後は変更しない）"""
     poem_id: int                          # 歌のID
     question_type: str                    # 問題タイプ
     question_text: str                    # 問題文
-    options: List[str]                    # 選択肢リスト（4択）
+    options: Tuple[str, ...]              # 選択肢（4択）
     correct_answer_index: int             # 正解のインデックス（0-3）
-    poem_data: Dict                       # 元の歌データ
+    poem_data: Poem                       # 元の歌データ（辞書も可）
     question_number: Optional[int] = None # 問題番号（何問目か）
     
     def get_correct_answer(self) -> str:
@@ -80,56 +140,107 @@ class Question:
         return selected_index == self.correct_answer_index
     
     def get_explanation(self) -> str:
-        """解説文を生成"""
-        poem = self.poem_data
-        explanation = f"【第{poem['id']}首】\n"
-        explanation += f"作者：{poem['author']}\n\n"
-        explanation += f"上の句：{poem['upper']}\n"
-        explanation += f"下の句：{poem['lower']}\n"
-        
-        # 読み仮名があれば追加
-        if 'reading_upper' in poem and poem['reading_upper']:
-            explanation += f"\n読み：\n"
-            explanation += f"  {poem['reading_upper']}\n"
-            explanation += f"  {poem['reading_lower']}\n"
-        
-        # 解説があれば追加
-        if 'description' in poem and poem['description']:
-            explanation += f"\n解説：\n{poem['description']}"
-        
-        return explanation
+        """解説文を生成（Poemの場合は歌ごとに結果を再利用）"""
+        if isinstance(self.poem_data, Poem):
+            return _cached_explanation(self.poem_data)
+        return _build_explanation(Poem.from_dict(self.poem_data))
+
+
+def _build_explanation(poem: Poem) -> str:
+    """歌データから解説文を生成する"""
+    explanation = f"【第{poem.id}首】\n"
+    explanation += f"作者：{poem.author}\n\n"
+    explanation += f"上の句：{poem.upper}\n"
+    explanation += f"下の句：{poem.lower}\n"
+    
+    # 読み仮名があれば追加
+    if poem.reading_upper:
+        explanation += f"\n読み：\n"
+        explanation += f"  {poem.reading_upper}\n"
+        explanation += f"  {poem.reading_lower}\n"
+    
+    # 解説があれば追加
+    if poem.description:
+        explanation += f"\n解説：\n{poem.description}"
+    
+    return explanation
+
 
+# 解説文のキャッシュ（Poemは不変でハッシュ可能なため、歌そのものをキーにする）
+_cached_explanation = lru_cache(maxsize=128)(_build_explanation)
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class QuizSession:
-    """クイズセッション管理クラス"""
+    """
+    クイズセッション管理クラス
+    
+    統計情報・進捗テキスト・スコアテキストは変更時に再計算して保持するため、
+    questions・score・total_answered・current_question_index などの状態は
+    add_question・submit_answer・next_question・reset などのメソッド経由でのみ変更すること。
+    （フィールドを直接書き換えると、これらの値が更新されない）
+    使用済み歌IDは出題順のリストと検索用の集合を対で保持するため、mark_poem_used でのみ記録し、
+    used_poem_ids は読み取り専用（タプル）として公開する。
+    """
     quiz_mode: QuizMode = QuizMode.SEQUENTIAL           # 出題モード
     question_types: List[str] = field(default_factory=lambda: [QuestionType.LOWER_MATCH.value])
     current_question_index: int = 0                     # 現在の問題インデックス
     questions: List[Question] = field(default_factory=list)  # 問題リスト
-    used_poem_ids: List[int] = field(default_factory=list)   # 使用済み歌ID
     score: int = 0                                      # 正解数
     total_answered: int = 0                             # 回答済み数
     current_answer: Optional[int] = None                # 現在の回答
     is_answered: bool = False                           # 回答済みフラグ
     max_questions: int = 100                            # 最大問題数
     answer_history: List[Dict] = field(default_factory=list)  # 回答履歴
+    _used_poem_ids: List[int] = field(default_factory=list, init=False)  # 使用済み歌ID（出題順）
+    _used_poem_id_set: Set[int] = field(default_factory=set, init=False, repr=False, compare=False)  # 使用済み歌ID（検索用）
+    _stats: Dict = field(default_factory=dict, init=False, repr=False, compare=False)  # 統計情報（変更時に更新）
+    _progress_text: str = field(default="", init=False, repr=False, compare=False)    # 進捗テキスト（変更時に更新）
+    _score_text: str = field(default="", init=False, repr=False, compare=False)       # スコアテキスト（変更時に更新）
+    _pending_questions: deque = field(default_factory=deque, init=False, repr=False, compare=False)  # 事前生成した未出題の問題
+    
+    def __post_init__(self) -> None:
+        """統計情報の初期化"""
+        self._update_statistics()
     
     def get_progress(self) -> str:
         """進捗状況を取得"""
-        return f"{self.current_question_index + 1}/{self.max_questions}"
+        return self._progress_text
     
     def get_score_text(self) -> str:
         """スコアテキストを取得"""
-        if self.total_answered == 0:
-            return "スコア: 0/0 (0%)"
-        accuracy = (self.score / self.total_answered) * 100
-        return f"スコア: {self.score}/{self.total_answered} ({accuracy:.1f}%)"
+        return self._score_text
     
-    def add_question(self, question: Question) -> None:
-        """問題を追加"""
-        question.question_number = len(self.questions) + 1
+    def add_question(self, question: Question) -> Question:
+        """問題を追加（問題番号を付けた問題を返す）"""
+        question = question._replace(question_number=len(self.questions) + 1)
         self.questions.append(question)
+        self._update_statistics()
+        return question
+    
+    @property
+    def used_poem_ids(self) -> Tuple[int, ...]:
+        """使用済み歌ID（出題順、読み取り専用）"""
+        return tuple(self._used_poem_ids)
+    
+    def mark_poem_used(self, poem_id: int) -> None:
+        """歌を使用済みとして記録"""
+        self._used_poem_ids.append(poem_id)
+        self._used_poem_id_set.add(poem_id)
+    
+    def set_pending_questions(self, questions: List[Question]) -> None:
+        """事前生成した問題を未出題の問題として登録"""
+        self._pending_questions = deque(questions)
+    
+    def pop_pending_question(self) -> Optional[Question]:
+        """未出題の問題を1問取り出す（残っていない場合None）"""
+        if self._pending_questions:
+            return self._pending_questions.popleft()
+        return None
+    
+    def get_used_poem_id_set(self) -> Set[int]:
+        """使用済み歌IDの集合を取得（存在確認用、変更しないこと）"""
+        return self._used_poem_id_set
     
     def get_current_question(self) -> Optional[Question]:
         """現在の問題を取得"""
@@ -147,10 +258,12 @@ class QuizSession:
         self.total_answered += 1
         
         question = self.get_current_question()
-        if question and question.check_answer(selected_index):
+        is_correct = bool(question and question.check_answer(selected_index))
+        if is_correct:
             self.score += 1
-            return True
-        return False
+        
+        self._update_statistics()
+        return is_correct
     
     def record_answer(self, question: Question, selected_index: int, is_correct: bool) -> None:
         """回答を履歴に記録"""
@@ -175,6 +288,7 @@ class QuizSession:
             self.current_question_index += 1
             self.current_answer = None
             self.is_answered = False
+            self._update_statistics()
             return True
         return False
     
@@ -182,19 +296,26 @@ class QuizSession:
         """セッションをリセット"""
         self.current_question_index = 0
         self.questions.clear()
-        self.used_poem_ids.clear()
+        self._used_poem_ids.clear()
+        self._used_poem_id_set.clear()
+        self._pending_questions.clear()
         self.score = 0
         self.total_answered = 0
         self.current_answer = None
         self.is_answered = False
         self.answer_history.clear()  # 回答履歴もクリア
+        self._update_statistics()
     
     def is_completed(self) -> bool:
         """クイズが完了したかチェック"""
         return self.current_question_index >= self.max_questions - 1 and self.is_answered
     
     def get_statistics(self) -> Dict:
-        """統計情報を取得"""
+        """統計情報を取得（保持している値を壊さないようコピーを返す）"""
+        return dict(self._stats)
+    
+    def _update_statistics(self) -> None:
+        """統計情報と表示用テキストを再計算する（問題の追加・回答・移動・リセット時に呼ばれる）"""
         stats = {
             "total_questions": len(self.questions),
             "answered": self.total_answered,
@@ -207,10 +328,15 @@ class QuizSession:
         if self.total_answered > 0:
             stats["accuracy"] = (self.score / self.total_answered) * 100
         
-        return stats
+        self._stats = stats
+        self._progress_text = f"{self.current_question_index + 1}/{self.max_questions}"
+        if self.total_answered == 0:
+            self._score_text = "スコア: 0/0 (0%)"
+        else:
+            self._score_text = f"スコア: {self.score}/{self.total_answered} ({stats['accuracy']:.1f}%)"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class QuizConfig:
     """クイズ設定クラス"""
     quiz_mode: QuizMode = QuizMode.SEQUENTIAL
@@ -225,6 +351,16 @@ class QuizConfig:
     show_description: bool = True  # 解説を表示
     time_limit: Optional[int] = None  # 制限時間（秒）、Noneは無制限
     
+    # from_dictで受け付ける項目と変換関数（Noneはそのまま代入）
+    _FIELD_HANDLERS = {
+        'quiz_mode': QuizMode,
+        'question_types': list,
+        'max_questions': None,
+        'show_reading': None,
+        'show_description': None,
+        'time_limit': None
+    }
+    
     def to_dict(self) -> Dict:
         """辞書形式に変換"""
         return {
@@ -240,29 +376,33 @@ class QuizConfig:
     def from_dict(cls, data: Dict) -> 'QuizConfig':
         """辞書から生成"""
         config = cls()
-        if 'quiz_mode' in data:
-            config.quiz_mode = QuizMode(data['quiz_mode'])
-        if 'question_types' in data:
-            config.question_types = data['question_types']
-        if 'max_questions' in data:
-            config.max_questions = data['max_questions']
-        if 'show_reading' in data:
-            config.show_reading = data['show_reading']
-        if 'show_description' in data:
-            config.show_description = data['show_description']
-        if 'time_limit' in data:
-            config.time_limit = data['time_limit']
+        handlers = cls._FIELD_HANDLERS
+        for key, value in data.items():
+            # 未知の項目は無視する
+            if key not in handlers:
+                continue
+            converter = handlers[key]
+            setattr(config, key, converter(value) if converter else value)
         return config
+    
+    def to_json_bytes(self) -> bytes:
+        """JSON（UTF-8のバイト列）に変換"""
+        return _json_dumps(self.to_dict())
+    
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> 'QuizConfig':
+        """JSON（UTF-8のバイト列）から生成"""
+        return cls.from_dict(_json_loads(data))
 
 
 # エラーメッセージ定義
-ERROR_MESSAGES = {
+ERROR_MESSAGES = MappingProxyType({
     "FileNotFoundError": "データファイルが見つかりません",
     "JSONDecodeError": "データファイルの形式が不正です",
     "IndexError": "問題の生成に失敗しました",
     "KeyError": "データに必要な項目が不足しています",
     "ValueError": "入力値が不正です"
-}
+})
 
 
 if __name__ == "__main__":
@@ -286,7 +426,7 @@ if __name__ == "__main__":
         poem_id=1,
         question_type=QuestionType.LOWER_MATCH.value,
         question_text="テスト問題",
-        options=["選択肢1", "選択肢2", "選択肢3", "選択肢4"],
+        options=("選択肢1", "選択肢2", "選択肢3", "選択肢4"),
         correct_answer_index=0,
         poem_data={"id": 1, "author": "テスト作者", "upper": "上の句", "lower": "下の句"}
     )
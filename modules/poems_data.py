@@ -0,0 +1,110 @@
+"""
+百人一首データ（自動生成）
+
+tools/gen_poems.py により data/hyakunin_isshu.json から生成。直接編集しないこと。
+"""
+from modules.models import Poem
+
+
+POEMS = (
+    Poem(id=1, author='天智天皇', upper='秋の田の かりほの庵の 苫をあらみ', lower='わが衣手は 露にぬれつつ', reading_upper='あきのたの かりほのいほの とまをあらみ', reading_lower='わがころもでは つゆにぬれつつ', description='【出典】後撰和歌集『秋』302番。【背景・情景】稲刈り期に田の畔に設けた仮小屋（庵）の粗い苫から露がしみ入り、袖が濡れていく素朴な農村の情景を写生。天皇詠ながら、権威から離れた生活感のある視線が魅力。【文学的ポイント】「仮庵」「苫」「露」の具象を連ねて体感的に季節を提示し、結句の反復法「〜つつ」で継続する濡れを時間的に示す。枕詞を用いず語の素朴さで力量を見せる。'),
+    Poem(id=2, author='持統天皇', upper='春過ぎて 夏来にけらし 白妙の', lower='衣ほすてふ 天の香具山', reading_upper='はるすぎて なつきにけらし しろたえの', reading_lower='ころもほすてふ あまのかぐやま', description='【出典】新古今和歌集『夏』175番。【背景・情景】大和三山の香具山に白衣が干されている光景から、季節が夏に移ったことを悟る歌。宮廷の年中行事（更衣）と大和の地勢が重なる。【文学的ポイント】「白妙の」は「衣」にかかる枕詞。視覚イメージ（白）で季節の転換を示す知的な序。伝聞「てふ（と言う）」により客観描写の距離感を保つ。'),
+    Poem(id=3, author='柿本人麻呂', upper='あしびきの 山鳥の尾の しだり尾の', lower='ながながし夜を ひとりかも寝む', reading_upper='あしびきの やまどりのおの しだりおの', reading_lower='ながながしよを ひとりかもねむ', description='【出典】拾遺和歌集『恋』778番。【背景・情景】長い尾を引く山鳥を縁語に、果てしなく長い孤独の夜を重ねる恋の歌。古代の宮廷歌人が私的感情の陰影を静かに響かせる。【文学的ポイント】「あしびきの」は山にかかる枕詞。「尾」の反復と比喩連鎖で“長さ”を強調し、結句の自問調「かも」で余情を残す。'),
+    Poem(id=4, author='山部赤人', upper='田子の浦に うち出でて見れば 白妙の', lower='富士の高嶺に 雪は降りつつ', reading_upper='たごのうらに うちいでてみれば しろたえの', reading_lower='ふじのたかねに ゆきはふりつつ', description='【出典】新古今和歌集『冬』675番。【背景・情景】田子の浦から望む富士の嶺に、雪がしきりに降る清澄の景。雄大な遠景を“今まさに見ている”視点で描く。【文学的ポイント】「白妙の」は白さを強調する枕詞。進行相を示す反復「降りつつ」により、静かな連続性と時間感覚を生む。自然詠の典型。'),
+    Poem(id=5, author='猿丸太夫', upper='奥山に もみぢ踏み分け 鳴く鹿の', lower='声聞く時ぞ 秋は悲しき', reading_upper='おくやまに もみぢふみわけ なくしかの', reading_lower='こえきくときぞ あきはかなしき', description='【出典】古今和歌集『秋』215番。【背景・情景】人の気配少ない奥山で鹿の声を聞く瞬間、秋の寂寥が胸に満ちる。狩猟・求愛期の鹿の鳴き（牡鹿の嘶き）が季の感情を喚起。【文学的ポイント】動作描写「踏み分け」→聴覚描写「鳴く鹿の声」の順で感覚を深化。結句を体言化せず「悲しき」で余情を残す古今調の感性。'),
+    Poem(id=6, author='中納言家持', upper='かささぎの 渡せる橋に 置く霜の', lower='白きを見れば 夜ぞ更けにける', reading_upper='かささぎの わたせるはしに おくしもの', reading_lower='しろきをみれば よぞふけにける', description='【出典】新古今和歌集『冬』620番。【背景・情景】七夕伝説の鵲（かささぎ）が架ける“天の川の橋”を連想させ、欄干に置く霜の白さが更けゆく夜を知らせる宮廷的幻想。作者は大伴家持。【文学的ポイント】伝説モチーフと現実の霜景を重ねる比喩。視覚から時間（夜の深まり）へ転換する構成が巧み。'),
+    Poem(id=7, author='安倍仲麻呂', upper='天の原 ふりさけ見れば 春日なる', lower='三笠の山に 出でし月かも', reading_upper='あまのはら ふりさけみれば かすがなる', reading_lower='みかさのやまに いでしつきかも', description='【出典】古今和歌集『羈旅』406番。【背景・情景】唐土に在る仲麻呂が、望む月に故郷の春日・三笠山を重ねる望郷の歌。遣唐留学生の実人生が反映。【文学的ポイント】遠景化する序詞風「天の原」、地名歌枕「春日」「三笠山」、詠嘆「かも」による余情。月＝普遍の象徴で空間を接続。'),
+    Poem(id=8, author='喜撰法師', upper='わが庵は 都のたつみ しかぞ住む', lower='世を宇治山と 人はいふなり', reading_upper='わがいほは みやこのたつみ しかぞすむ', reading_lower='よをうじやまと ひとはいうなり', description='【出典】古今和歌集『雑』983番。【背景・情景】都の南東・宇治の山里に庵を結ぶ隠者の自己紹介。世俗を“憂し（うじ）”と嘆きつつ、地名“宇治”と掛ける。六歌仙・喜撰法師の伝説的風姿。【文学的ポイント】地口・掛詞（世を“憂し”⇔宇治）と地名歌枕の妙味。首句切れで居場所を先に定義し、下句で評判（人はいふ）を客観化。'),
+    Poem(id=9, author='小野小町', upper='花の色は うつりにけりな いたづらに', lower='わが身世にふる ながめせし間に', reading_upper='はなのいろは うつりにけりな いたづらに', reading_lower='わがみよにふる ながめせしまに', description='【出典】古今和歌集『春』113番。【背景・情景】長雨の季節、花の色が褪せるうちに自らの盛りも過ぎていくと嘆ずる。美と無常の自己省察。【文学的ポイント】「ながめ（眺め／長雨）」の掛詞、「いたづらに」による空費感、上句の断定「けりな」で感情の落差を強調。小町歌の典型的“もののあはれ”。'),
+    Poem(id=10, author='蝉丸', upper='これやこの 行くも帰るも 別れては', lower='知るも知らぬも 逢坂の関', reading_upper='これやこの ゆくもかえるも わかれては', reading_lower='しるもしらぬも おうさかのせき', description='【出典】後撰和歌集『雑』1089番。【背景・情景】東西交通の要衝・逢坂の関で、人の往来・出会い・別れが交錯するさまを感嘆とともに詠む。作者は伝説的音楽家・蝉丸。【文学的ポイント】指示語連呼「これやこの」による現場性、対句「行くも／帰るも」「知るも／知らぬも」の並列で普遍性を表し、地名歌枕で場所性を固定。'),
+    Poem(id=11, author='参議篁', upper='わたの原 八十島かけて 漕ぎ出でぬと', lower='人には告げよ あまのつり舟', reading_upper='わたのはら やそしまかけて こぎいでぬと', reading_lower='ひとにはつげよ あまのつりぶね', description='【出典】古今和歌集『羈旅』407番。【背景・情景】遣隠（隠岐流罪）に向かう船上から、海人の釣舟に故郷の人々へ消息を託す情景。作者は小野篁。【文学的ポイント】広大な海原「わたの原」に島々を連ねる視覚的スケール感。命令形「告げよ」による直接性と切実さが際立つ。'),
+    Poem(id=12, author='僧正遍昭', upper='天つ風 雲の通ひ路 吹きとぢよ', lower='をとめの姿 しばしとどめむ', reading_upper='あまつかぜ くものかよいじ ふきとじよ', reading_lower='おとめのすがた しばしとどめん', description='【出典】古今和歌集『雑下』994番。【背景・情景】天女が舞い降りる様を、天の風に雲の道を閉ざして留めたいと願う宮廷的想像。作者は六歌仙の一人、遍昭。【文学的ポイント】擬人化と命令形で生まれる遊戯的華やぎ。視覚（雲）、触覚（風）、動作（吹きとぢよ）を組み合わせた多感覚表現。'),
+    Poem(id=13, author='陽成院', upper='筑波嶺の 峰より落つる みなの川', lower='恋ぞつもりて 淵となりぬる', reading_upper='つくばねの みねよりおつる みなのがわ', reading_lower='こいぞつもりて ふちとなりぬる', description='【出典】古今和歌集『恋』663番。【背景・情景】筑波山の男女川が水を集めて深い淵になるように、恋情が積もって深くなる様を詠む。陽成天皇の作。【文学的ポイント】地名歌枕「筑波嶺」、序詞「峰より落つる」による自然の動きと心情の連動。結句の完了「なりぬる」で恋の成就／行き着きを暗示。'),
+    Poem(id=14, author='河原左大臣', upper='みちのくの しのぶもぢずり 誰ゆゑに', lower='乱れそめにし 我ならなくに', reading_upper='みちのくの しのぶもじずり たれゆえに', reading_lower='みだれそめにし われならなくに', description='【出典】後撰和歌集『恋』740番。【背景・情景】陸奥名産の「しのぶもぢずり（忍ぶ葛の摺り模様）」の乱れを恋心にたとえる。自ら望まぬのに心が乱れたと詠嘆。作者は源融。【文学的ポイント】地名歌枕＋縁語「しのぶ（忍ぶ）」の掛詞。「乱れ」は模様と感情の二重意味。上句の技巧で下句の感情が引き立つ。'),
+    Poem(id=15, author='光孝天皇', upper='君がため 春の野に出でて 若菜摘む', lower='わが衣手に 雪は降りつつ', reading_upper='きみがため はるののにいでて わかなつむ', reading_lower='わがころもでに ゆきはふりつつ', description='【出典】古今和歌集『春』21番。【背景・情景】大切な人のために春の若菜を摘みに出かけるが、衣には雪が降りかかる情景。冬から春への端境期を表現。【文学的ポイント】献身の動機「君がため」を冒頭に置く直情。季節の二重描写（若菜＝春、雪＝冬）で時間の交錯を生む。'),
+    Poem(id=16, author='中納言行平', upper='立ち別れ いなばの山の 峰に生ふる', lower='まつとし聞かば 今帰り来む', reading_upper='たちわかれ いなばのやまの みねにおうる', reading_lower='まつとしきかば いまかえりこむ', description='【出典】古今和歌集『羈旅』402番。【背景・情景】任地に赴く行平が、因幡国の「まつ（松）」に掛けて、待つと聞けばすぐに帰ると詠う。【文学的ポイント】地名歌枕「いなば」、掛詞「まつ（松／待つ）」の洒落。約束の誠実さを誇張する未来意志形で結ぶ。'),
+    Poem(id=17, author='在原業平朝臣', upper='千早ぶる 神代も聞かず 竜田川', lower='からくれなゐに 水くくるとは', reading_upper='ちはやぶる かみよもきかず たつたがわ', reading_lower='からくれないに みずくくるとは', description='【出典】古今和歌集『秋』294番。【背景・情景】紅葉が川面を覆い、流れを真紅に染める竜田川の景を神代にもなかったと驚く。業平らしい雅な感性。【文学的ポイント】枕詞「ちはやぶる」で神への荘厳な導入。色彩語「からくれなゐ」、動詞「水くくる」（染める）で視覚の鮮烈さを描写。'),
+    Poem(id=18, author='藤原敏行朝臣', upper='住の江の 岸に寄る波 よるさへや', lower='夢の通ひ路 人目よくらむ', reading_upper='すみのえの きしによるなみ よるさえや', reading_lower='ゆめのかよいじ ひとめよくらん', description='【出典】古今和歌集『恋』664番。【背景・情景】昼も夜も波が寄る住吉の浜になぞらえ、夢の中でさえ逢わないのは人目を避けているのかと嘆く。【文学的ポイント】縁語「寄る波／夜」「通ひ路／夢」の技巧。問いかける結句で未練と疑念を表現。'),
+    Poem(id=19, author='伊勢', upper='難波潟 短き葦の ふしの間も', lower='逢はでこの世を 過ぐしてよとや', reading_upper='なにわがた みじかきあしの ふしのまも', reading_lower='あわでこのよを すぐしてよとや', description='【出典】古今和歌集『恋』665番。【背景・情景】難波潟の短い葦の節間にたとえ、ほんの短い間さえ逢わずに生きよというのかと嘆く女性の恋歌。【文学的ポイント】地名歌枕「難波潟」、掛詞「葦の節（ふし）／節（時節）」で時間の短さを強調。反語的問いで感情を高める。'),
+    Poem(id=20, author='元良親王', upper='わびぬれば 今はた同じ 難波なる', lower='みをつくしても 逢はむとぞ思ふ', reading_upper='わびぬれば いまはたおなじ なにわなる', reading_lower='みをつくしても あわむとぞおもう', description='【出典】古今和歌集『恋』666番。【背景・情景】辛さに耐えかね、命を尽くしてでも逢おうと決意する情熱的な恋歌。地名「難波」と「澪標（みおつくし）」の掛詞が効く。【文学的ポイント】絶望と覚悟を同時に詠む二段構え。掛詞と体言止めで強靭な響きを残す。'),
+    Poem(id=21, author='素性法師', upper='今来むと 言ひしばかりに 長月の', lower='有明の月を 待ち出でつるかな', reading_upper='いまこむと いいしばかりに ながつきの', reading_lower='ありあけのつきを まちいでつるかな', description='【出典】古今和歌集『恋』674番。【背景・情景】恋人が「今行く」と言ったのを信じ、夜明け近くまで待ってしまった女性の心情。秋の有明の月が静かに照らす夜明け前の情景。【文学的ポイント】時間感覚の誇張で切なさを強調。「有明の月」は夜明け間際まで残る月で、期待と徒労を象徴。'),
+    Poem(id=22, author='文屋康秀', upper='吹くからに 秋の草木の しをるれば', lower='むべ山風を 嵐といふらむ', reading_upper='ふくからに あきのくさきの しをるれば', reading_lower='むべやまかぜを あらしというらん', description='【出典】古今和歌集『秋』296番。【背景・情景】山から吹く風が草木を枯らす様を見て、これこそ「嵐」と呼ぶ理由だと納得する風景詠。【文学的ポイント】因果関係を示す「からに」で即時性を強調。語呂合わせ的な結び「むべ〜らむ」に軽妙な風趣。'),
+    Poem(id=23, author='大江千里', upper='月見れば 千々に物こそ 悲しけれ', lower='わが身一つの 秋にはあらねど', reading_upper='つきみれば ちぢにものこそ かなしけれ', reading_lower='わがみひとつの あきにはあらねど', description='【出典】古今和歌集『秋』315番。【背景・情景】澄んだ秋の月を眺めると、あれこれと物思いが募り悲しくなる。秋の物寂しさは自分だけのものではないと悟る。【文学的ポイント】秋＝寂寥という古典的連想を内省的に展開。逆接の下句が感情の普遍性を示す。'),
+    Poem(id=24, author='菅家', upper='このたびは 幣も取りあへず 手向山', lower='紅葉の錦 神のまにまに', reading_upper='このたびは ぬさもとりあえず たむけやま', reading_lower='もみじのにしき かみのまにまに', description='【出典】古今和歌集『秋』317番。【背景・情景】旅の途中、手向山で幣帛（神への供え物）を用意できず、代わりに紅葉を神への捧げ物とする歌。菅原道真の作。【文学的ポイント】即興性と自然崇拝。紅葉を「錦」に喩えることで秋の色彩美を神聖化。'),
+    Poem(id=25, author='三条右大臣', upper='名にし負はば 逢坂山の さねかづら', lower='人に知られで 来るよしもがな', reading_upper='なにしおわば おうさかやまの さねかずら', reading_lower='ひとにしられで くるよしもがな', description='【出典】古今和歌集『恋』683番。【背景・情景】「逢坂山」の名に因み、逢うことを望みながら、人目を忍んで来られる手段があればと願う恋歌。【文学的ポイント】地名歌枕「逢坂」、植物名「さねかづら」の縁語を活かした技巧。秘めた恋の切実さ。'),
+    Poem(id=26, author='貞信公', upper='小倉山 峰のもみぢ葉 心あらば', lower='今ひとたびの みゆき待たなむ', reading_upper='おぐらやま みねのもみじば こころあらば', reading_lower='いまひとたびの みゆきまたなん', description='【出典】古今和歌集『秋』298番。【背景・情景】紅葉の盛りを迎えた小倉山に向かい、もし心があるならもう一度の帝の行幸まで散らずにいてほしいと願う。【文学的ポイント】擬人化された自然観。尊敬対象への敬意と季節の美が融合。'),
+    Poem(id=27, author='中納言兼輔', upper='みかの原 わきて流るる いづみ川', lower='いつ見きとてか 恋しかるらむ', reading_upper='みかのはら わきてながるる いづみがわ', reading_lower='いつみきとてか こいしかるらん', description='【出典】古今和歌集『恋』684番。【背景・情景】水源から清らかに流れる泉川を見て、いつ会ったからこんなにも恋しく思うのかと不思議がる恋情。【文学的ポイント】地名「みかの原」、水の流れ＝恋心の流れという象徴的対応。'),
+    Poem(id=28, author='源宗于朝臣', upper='山里は 冬ぞ寂しさ まさりける', lower='人目も草も かれぬと思へば', reading_upper='やまざとは ふゆぞさびしさ まさりける', reading_lower='ひとめもくさも かれぬとおもえば', description='【出典】古今和歌集『冬』332番。【背景・情景】山里の冬は人の訪れも草の緑も絶え、いっそう寂しく感じられるという情景。【文学的ポイント】対句的な「人目も草も」の並列で全的静寂を表現。'),
+    Poem(id=29, author='凡河内躬恒', upper='心あてに 折らばや折らむ 初霜の', lower='置きまどはせる 白菊の花', reading_upper='こころあてに おらばやおらん はつしもの', reading_lower='おきまどわせる しらぎくのはな', description='【出典】古今和歌集『秋』309番。【背景・情景】白菊の花に初霜が降り、花と霜とが見分けにくい中、目当てをつけて折ろうとする繊細な情景。【文学的ポイント】視覚の錯覚を用いた趣向。白一色の中の気配を読む美意識。'),
+    Poem(id=30, author='壬生忠岑', upper='有明の つれなく見えし 別れより', lower='暁ばかり 憂きものはなし', reading_upper='ありあけの つれなくみえし わかれより', reading_lower='あかつきばかり うきものはなし', description='【出典】古今和歌集『恋』685番。【背景・情景】有明の月のように冷ややかに見えた別れ以来、夜明けほど辛い時間はないと詠嘆。【文学的ポイント】「有明の月」と恋人の態度を重ねる比喩。時間帯を限定して感情の鋭さを増す。'),
+    Poem(id=31, author='坂上是則', upper='朝ぼらけ 有明の月と 見るまでに', lower='吉野の里に 降れる白雪', reading_upper='あさぼらけ ありあけのつきと みるまでに', reading_lower='よしののさとに ふれるしらゆき', description='【出典】古今和歌集『冬』332番。【背景・情景】夜明けの薄明かりの中、有明の月かと思うほどに、吉野の里には白雪が一面に降り積もっている情景。【文学的ポイント】月と雪の色彩を重ねる視覚的比喩が美しい。吉野は桜と同時に雪景色でも名高い土地。'),
+    Poem(id=32, author='春道列樹', upper='山川に 風のかけたる しがらみは', lower='流れもあへぬ 紅葉なりけり', reading_upper='やまかわに かぜのかけたる しがらみは', reading_lower='ながれもあえぬ もみじなりけり', description='【出典】古今和歌集『秋』303番。【背景・情景】山の川に吹く風が、紅葉を集めてせき止めている様を、仮の「しがらみ」に見立てた詩趣。【文学的ポイント】擬人化された自然描写と巧みな言葉遊び。「しがらみ」は川をせき止める柵の意。'),
+    Poem(id=33, author='紀友則', upper='久方の 光のどけき 春の日に', lower='しづ心なく 花の散るらむ', reading_upper='ひさかたの ひかりのどけき はるのひに', reading_lower='しづこころなく はなのちるらん', description='【出典】古今和歌集『春』84番。【背景・情景】春の穏やかな日差しの中、どうして桜は静けさを知らずに散ってしまうのかと嘆く歌。【文学的ポイント】「ひさかたの」は光の枕詞。花＝桜の儚さと春の盛りの対比が際立つ。'),
+    Poem(id=34, author='藤原興風', upper='誰をかも 知る人にせむ 高砂の', lower='松も昔の 友ならなくに', reading_upper='たれをかも しるひとにせん たかさごの', reading_lower='まつもむかしの ともならなくに', description='【出典】古今和歌集『雑下』998番。【背景・情景】年月が経ち、かつての友もいなくなった寂しさを、高砂の松に喩える。【文学的ポイント】松＝不変の象徴としつつも、自分の周囲は変わってしまったという無常観を表現。'),
+    Poem(id=35, author='紀貫之', upper='人はいさ 心も知らず ふるさとは', lower='花ぞ昔の 香に匂ひける', reading_upper='ひとはいさ こころもしらず ふるさとは', reading_lower='はなぞむかしの かににおいける', description='【出典】古今和歌集『春』42番。【背景・情景】人の心は変わるものだが、故郷の梅の花は昔と変わらず香りを放っているという感慨。【文学的ポイント】人の移ろいと自然の不変性を対比させる典雅な構成。'),
+    Poem(id=36, author='清原深養父', upper='夏の夜は まだ宵ながら 明けぬるを', lower='雲のいづこに 月宿るらむ', reading_upper='なつのよは まだよいながら あけぬるを', reading_lower='くものいづこに つきやどるらん', description='【出典】古今和歌集『夏』165番。【背景・情景】夏の短い夜は、まだ宵のような気分のうちに夜明けを迎える。月はどこに宿るのだろうかと想う情景。【文学的ポイント】時間の速さを惜しむ夏夜の情趣。雲と月の取り合わせが幻想的。'),
+    Poem(id=37, author='文屋朝康', upper='白露に 風の吹きしく 秋の野は', lower='つらぬきとめぬ 玉ぞ散りける', reading_upper='しらつゆに かぜのふきしく あきののは', reading_lower='つらぬきとめぬ たまぞちりける', description='【出典】古今和歌集『秋』314番。【背景・情景】白露が風に吹かれ散る秋の野は、糸に通していない真珠がこぼれるようだと詠む。【文学的ポイント】自然現象を宝石に喩える優美な比喩。'),
+    Poem(id=38, author='右近', upper='忘らるる 身をば思はず 誓ひてし', lower='人の命の 惜しくもあるかな', reading_upper='わすらるる みをばおもわず ちかいてし', reading_lower='ひとのいのちの おしくもあるかな', description='【出典】後撰和歌集『恋』740番。【背景・情景】愛を誓ったのに忘れられた恨みよりも、誓いを破ったことでその人が神罰を受けるのではと命を惜しむ心。【文学的ポイント】自己犠牲的な恋情。誓いの重みを前提とする価値観。'),
+    Poem(id=39, author='参議等', upper='浅茅生の 小野の篠原 しのぶれど', lower='あまりてなどか 人の恋しき', reading_upper='あさじふの おののしのはら しのぶれど', reading_lower='あまりてなどか ひとのこいしき', description='【出典】後撰和歌集『恋』768番。【背景・情景】忍ぶ草の茂る野原のように、人目を忍んで恋しても、どうしてこんなに恋しさが募るのかと詠む。【文学的ポイント】序詞と掛詞を駆使した技巧的恋歌。'),
+    Poem(id=40, author='平兼盛', upper='忍ぶれど 色に出でにけり わが恋は', lower='物や思ふと 人の問ふまで', reading_upper='しのぶれど いろにいでにけり わがこいは', reading_lower='ものやおもうと ひとのとうまで', description='【出典】拾遺和歌集『恋』1005番。【背景・情景】恋心を隠していても顔色に現れてしまい、人に「何か思っているのか」と問われるまでになった状況。【文学的ポイント】感情の抑えきれなさと人目の鋭さを端的に表現。'),
+    Poem(id=41, author='壬生忠見', upper='恋すてふ 我が名はまだき 立ちにけり', lower='人知れずこそ 思ひそめしか', reading_upper='こいすちょう わがなはまだき たちにけり', reading_lower='ひとしれずこそ おもいそめしか', description='【出典】後撰和歌集『恋』759番。【背景・情景】密かに恋を始めたばかりなのに、もう世間に「恋している」と噂が立ってしまった自嘲の歌。【文学的ポイント】「恋すてふ」は「恋するという」の意。秘密のはずが早くも露見する滑稽味と切なさが同居。'),
+    Poem(id=42, author='清原元輔', upper='契りきな かたみに袖を しぼりつつ', lower='末の松山 波越さじとは', reading_upper='ちぎりきな かたみにそでを しぼりつつ', reading_lower='すえのまつやま なみこさじとは', description='【出典】後撰和歌集『恋』770番。【背景・情景】互いに涙で袖を濡らしながら、「末の松山の波も越えないほどに」変わらぬ愛を誓い合った昔を回想。【文学的ポイント】「末の松山」は宮城県名取市付近にある景勝地で、不変の象徴として用いられる。'),
+    Poem(id=43, author='中納言朝忠', upper='逢ひ見ての 後の心に くらぶれば', lower='昔は物を 思はざりけり', reading_upper='あいみての のちのこころに くらぶれば', reading_lower='むかしはものを おもわざりけり', description='【出典】後撰和歌集『恋』767番。【背景・情景】恋人と実際に逢ってしまった後の切なさに比べれば、逢う前の想いなど大したことはなかったと振り返る。【文学的ポイント】恋愛感情の変化を直接的に述べる率直な口調が魅力。'),
+    Poem(id=44, author='権中納言敦忠', upper='逢ふことの 絶えてしなくは なかなかに', lower='人をも身をも 恨みざらまし', reading_upper='あうことの たえてしなくは なかなかに', reading_lower='ひとをもみをも うらみざらまし', description='【出典】後撰和歌集『恋』772番。【背景・情景】もし逢うことが全くなければ、恋の苦しみもなく、相手も自分も恨まずに済んだだろうにと嘆く歌。【文学的ポイント】恋の「喜び」と「苦しみ」の両面を見据える心理の深さが表れている。'),
+    Poem(id=45, author='中納言兼輔', upper='あはれとも いふべき人は 思ほえで', lower='身のいたづらに なりぬべきかな', reading_upper='あわれとも いうべきひとは おもおえで', reading_lower='みのいたずらに なりぬべきかな', description='【出典】後撰和歌集『恋』776番。【背景・情景】恋の苦しみを「あわれ」と共感してくれる人がいないまま、自分の命も空しく終わってしまいそうだと詠む。【文学的ポイント】孤独感と死生観が交錯する静かな悲哀の歌。'),
+    Poem(id=46, author='曽禰好忠', upper='由良のとを 渡る舟人 かぢを絶え', lower='行くへも知らぬ 恋のみちかな', reading_upper='ゆらのとを わたるふなびと かじをたえ', reading_lower='ゆくえもしらぬ こいのみちかな', description='【出典】拾遺和歌集『恋』1036番。【背景・情景】由良の瀬戸を行く舟人が舵を失い、行き先もわからなくなった様子を、先の見えない恋路に喩える。【文学的ポイント】海路の比喩による恋の迷いと不安の表現が鮮やか。'),
+    Poem(id=47, author='恵慶法師', upper='八重むぐら 茂れる宿の 寂しきに', lower='人こそ見えね 秋は来にけり', reading_upper='やえむぐら しげれるやどの さびしきに', reading_lower='ひとこそみえね あきはきにけり', description='【出典】拾遺和歌集『秋』277番。【背景・情景】人の訪れも絶え、草が生い茂った荒れた宿に、寂しさの中で秋が訪れた情景。【文学的ポイント】荒廃と季節感を結びつけ、時間の経過と孤独を表現する。'),
+    Poem(id=48, author='源重之', upper='風をいたみ 岩うつ波の おのれのみ', lower='くだけて物を 思ふころかな', reading_upper='かぜをいたみ いわうつなみの おのれのみ', reading_lower='くだけてものを おもうころかな', description='【出典】後拾遺和歌集『恋』876番。【背景・情景】風が激しく、岩に当たって砕ける波のように、自分だけが恋の苦しみに打ち砕かれていると詠む。【文学的ポイント】自然現象を通して自己の感情を映し出す、和歌の典型的手法。'),
+    Poem(id=49, author='大中臣能宣', upper='みかき守 衛士のたく火の 夜は燃え', lower='昼は消えつつ 物をこそ思へ', reading_upper='みかきもり えじのたくひの よるはもえ', reading_lower='ひるはきえつつ ものをこそおもえ', description='【出典】拾遺和歌集『恋』898番。【背景・情景】宮中を守る衛士の焚く火のように、夜は恋の思いが燃え、昼は鎮まる様を詠む。【文学的ポイント】昼夜の対比による感情の移り変わりの表現が巧み。'),
+    Poem(id=50, author='藤原義孝', upper='君がため 惜しからざりし 命さへ', lower='長くもがなと 思ひけるかな', reading_upper='きみがため おしからざりし いのちさえ', reading_lower='ながくもがなと おもいけるかな', description='【出典】後拾遺和歌集『恋』896番。【背景・情景】君のためなら命も惜しくないと思っていたが、今は少しでも長く生きていたいと思うようになった心の変化。【文学的ポイント】恋情の深化と執着の芽生えを素直に表現。'),
+    Poem(id=51, author='藤原実方朝臣', upper='かくとだに えやはいぶきの さしも草', lower='さしも知らじな 燃ゆる思ひを', reading_upper='かくとだに えやはいぶきの さしもぐさ', reading_lower='さしもしらじな もゆるおもいを', description='【出典】後拾遺和歌集『恋』889番。【背景・情景】せめて「こうだ」とも告げられない恋心を、伊吹山のさしも草（よもぎ）にたとえた。相手は知らずにいるが、自分の思いは燃え続けている。【文学的ポイント】「さしも草」は香気があり火にくべると煙を立てる。火と香の両面で恋心を象徴する。'),
+    Poem(id=52, author='藤原道信朝臣', upper='明けぬれば 暮るるものとは 知りながら', lower='なおうらめしき 朝ぼらけかな', reading_upper='あけぬれば くるるものとは しりながら', reading_lower='なおうらめしき あさぼらけかな', description='【出典】後拾遺和歌集『恋』887番。【背景・情景】明ければまた夜が来ると分かっていても、恋人と別れねばならない朝は恨めしい。【文学的ポイント】時間の必然性を知りつつも感情が逆らう、人間らしい弱さがにじむ。'),
+    Poem(id=53, author='右大将道綱母', upper='嘆きつつ ひとり寝る夜の 明くる間は', lower='いかに久しき ものとかは知る', reading_upper='なげきつつ ひとりぬるよの あくるまは', reading_lower='いかにひさしき ものとかはしる', description='【出典】拾遺和歌集『恋』1024番。【背景・情景】恋人を待ちながら一人で過ごす夜の長さを、嘆きとともに詠む。【文学的ポイント】個人的な体験を普遍的な孤独の情景として描く、女性歌人ならではの感性。'),
+    Poem(id=54, author='儀同三司母', upper='忘れじの 行く末までは かたければ', lower='今日を限りの 命ともがな', reading_upper='わすれじの ゆくすえまでは かたければ', reading_lower='きょうをかぎりの いのちともがな', description='【出典】拾遺和歌集『恋』1031番。【背景・情景】「忘れない」という誓いが永遠に続くとは思えないから、いっそ今日限りで命を終えたいと詠む。【文学的ポイント】恋の無常観と死への願望を直截に表す強烈な情熱が印象的。'),
+    Poem(id=55, author='大納言公任', upper='滝の音は たえて久しく なりぬれど', lower='名こそ流れて なほ聞こえけれ', reading_upper='たきのおとは たえてひさしく なりぬれど', reading_lower='なこそながれて なおきこえけれ', description='【出典】拾遺和歌集『雑』1287番。【背景・情景】滝の音は途絶えても、その名は流れ続けて人々に知られている。恋や人の名誉の比喩として解釈されることも多い。【文学的ポイント】音と名の対比による永続性の象徴表現。'),
+    Poem(id=56, author='和泉式部', upper='あらざらむ この世のほかの 思ひ出に', lower='いまひとたびの 逢ふこともがな', reading_upper='あらざらん このよのほかの おもいでに', reading_lower='いまひとたびの あうこともがな', description='【出典】後拾遺和歌集『恋』894番。【背景・情景】もうすぐこの世を去る身の最後の思い出として、もう一度だけ逢いたいという切なる願い。【文学的ポイント】死を目前にした恋情の美と儚さが際立つ。'),
+    Poem(id=57, author='紫式部', upper='めぐり逢ひて 見しやそれとも 分かぬ間に', lower='雲がくれにし 夜半の月かな', reading_upper='めぐりあいて みしやそれとも わかぬまに', reading_lower='くもがくれにし よわのつきかな', description='【出典】後拾遺和歌集『雑』1270番。【背景・情景】久しぶりに会ったのに、それと気付く間もなく別れてしまった切なさを、雲に隠れる月にたとえる。【文学的ポイント】短い再会の儚さを月のイメージで印象的に描く。'),
+    Poem(id=58, author='大弐三位', upper='有馬山 猪名の笹原 風吹けば', lower='いでそよ人を 忘れやはする', reading_upper='ありまやま いなのささはら かぜふけば', reading_lower='いでそよひとを わすれやはする', description='【出典】後拾遺和歌集『恋』882番。【背景・情景】有馬山と猪名川の笹原に風が吹くとそよぐ音のように、あなたを忘れることなどないと詠む。【文学的ポイント】地名と自然描写を通して不変の愛情を誓う典雅な表現。'),
+    Poem(id=59, author='赤染衛門', upper='やすらはで 寝なましものを さ夜ふけて', lower='かたぶくまでの 月を見しかな', reading_upper='やすらわで ねなましものを さよふけて', reading_lower='かたぶくまでの つきをみしかな', description='【出典】後拾遺和歌集『恋』885番。【背景・情景】迷わず寝てしまえばよかったのに、夜更けまで月を眺めて過ごしてしまったという未練の情。【文学的ポイント】「かたぶく」は月が西に傾く意。時間経過の叙情性が高い。'),
+    Poem(id=60, author='小式部内侍', upper='大江山 いく野の道の 遠ければ', lower='まだふみも見ず 天の橋立', reading_upper='おおえやま いくののみちの とおければ', reading_lower='まだふみもみず あまのはしだて', description='【出典】金葉和歌集『雑下』747番。【背景・情景】都から遠い大江山や生野を経る道のように、母のいる丹後の天橋立へはまだ行ったことも文を送ったこともないと詠む。【文学的ポイント】地名を駆使した才気あふれる返歌として有名。'),
+    Poem(id=61, author='伊勢大輔', upper='いにしへの 奈良の都の 八重桜', lower='けふ九重に にほひぬるかな', reading_upper='いにしえの ならのみやこの やえざくら', reading_lower='きょうここのえに においぬるかな', description='【出典】詞花和歌集『春』42番。【背景・情景】昔の奈良の都に咲いていた八重桜が、今日は京都御所の九重に咲き誇っている情景を描く。【文学的ポイント】花を時空を越える存在として描き、王朝文化の連続性を示す。'),
+    Poem(id=62, author='清少納言', upper='夜をこめて 鳥のそら音は はかるとも', lower='よに逢坂の 関は許さじ', reading_upper='よをこめて とりのそらねは はかるとも', reading_lower='よにおうさかの せきはゆるさじ', description='【出典】後拾遺和歌集『雑』1285番。【背景・情景】まだ夜が明けぬうちに鶏の鳴きまねをしても、逢坂の関が開くことはない、という機知に富んだ恋歌。【文学的ポイント】地名「逢坂」と「逢う」の掛詞、関と関所の二重意味が巧み。'),
+    Poem(id=63, author='左京大夫道雅', upper='今はただ 思ひ絶えなむ とばかりを', lower='人づてならで 言ふよしもがな', reading_upper='いまはただ おもいたえなん とばかりを', reading_lower='ひとづてならで いうよしもがな', description='【出典】後拾遺和歌集『恋』905番。【背景・情景】もはや思いを断ち切ろうとしていることを、人づてではなく直接伝えたいという切なさを詠む。【文学的ポイント】間接性から直接性への願望を率直に述べる潔さ。'),
+    Poem(id=64, author='権中納言定頼', upper='朝ぼらけ 宇治の川霧 たえだえに', lower='あらはれわたる 瀬々の網代木', reading_upper='あさぼらけ うじのかわぎり たえだえに', reading_lower='あらわれわたる せぜのあじろぎ', description='【出典】千載和歌集『冬』386番。【背景・情景】冬の朝、宇治川の霧が切れ間から見える瀬の網代木（魚を捕る仕掛け）を描写。【文学的ポイント】視覚と間接的な表現により、朝の静謐な情景が浮かび上がる。'),
+    Poem(id=65, author='相模', upper='恨みわび ほさぬ袖だに あるものを', lower='恋にくちなむ 名こそ惜しけれ', reading_upper='うらみわび ほさぬそでだに あるものを', reading_lower='こいにくちなむ なこそおしけれ', description='【出典】後拾遺和歌集『恋』918番。【背景・情景】恋の恨みと嘆きに濡れ続ける袖、それだけでも辛いのに、その恋で自分の名まで傷つくのは惜しいと詠む。【文学的ポイント】恋の苦悩に名誉の問題を絡める、貴族社会らしい感覚。'),
+    Poem(id=66, author='大僧正行尊', upper='もろともに あはれと思へ 山桜', lower='花よりほかに 知る人もなし', reading_upper='もろともに あわれとおもえ やまざくら', reading_lower='はなよりほかに しるひともなし', description='【出典】金葉和歌集『春』65番。【背景・情景】山奥でひとり花を眺める僧が、山桜にだけは自分の感慨を分かってほしいと語りかける。【文学的ポイント】孤独と自然との心の交流を示す、山家詩的情趣。'),
+    Poem(id=67, author='周防内侍', upper='春の夜の 夢ばかりなる 手枕に', lower='かひなく立たむ 名こそ惜しけれ', reading_upper='はるのよの ゆめばかりなる たまくらに', reading_lower='かいなくたたん なこそおしけれ', description='【出典】千載和歌集『恋』789番。【背景・情景】春の夜の夢のように儚い関係のために、悪い評判が立つのは惜しいと詠む。【文学的ポイント】短命な春の夜と短い恋を重ねた比喩が美しい。'),
+    Poem(id=68, author='三条院', upper='心にも あらでうき世に 長らへば', lower='恋しかるべき 夜半の月かな', reading_upper='こころにも あらでうきよに ながらえば', reading_lower='こいしかるべき よわのつきかな', description='【出典】後拾遺和歌集『雑』1303番。【背景・情景】本意ではなく辛い世を生き長らえたならば、かえって恋しく思い出すであろう今夜の月。【文学的ポイント】無常観と今を愛おしむ感情を融合させた詩的哲学。'),
+    Poem(id=69, author='能因法師', upper='嵐吹く 三室の山の もみぢ葉は', lower='龍田の川の 錦なりけり', reading_upper='あらしふく みむろのやまの もみじばは', reading_lower='たつたのかわの にしきなりけり', description='【出典】詞花和歌集『秋』274番。【背景・情景】嵐が吹き落とした三室山の紅葉が龍田川を流れ、まるで錦織のように美しい。【文学的ポイント】色彩感覚豊かな比喩で紅葉を華麗に描く古典的名歌。'),
+    Poem(id=70, author='良暹法師', upper='さびしさに 宿を立ち出でて ながむれば', lower='いづこも同じ 秋の夕暮れ', reading_upper='さびしさに やどをたちいでて ながむれば', reading_lower='いづこもおなじ あきのゆうぐれ', description='【出典】後拾遺和歌集『秋』377番。【背景・情景】寂しさに耐えかねて外に出ても、どこも同じように物寂しい秋の夕暮れであることを詠む。【文学的ポイント】秋夕暮の寂寥感を端的に表す和歌の典型として知られる。'),
+    Poem(id=71, author='大納言経信', upper='夕されば 門田の稲葉 おとづれて', lower='蘆のまろやに 秋風ぞ吹く', reading_upper='ゆうされば かどたのいなば おとづれて', reading_lower='あしのまろやに あきかぜぞふく', description='【出典】後拾遺和歌集『秋』376番。【背景・情景】夕暮れ時、門口の田の稲葉が秋風にそよぎ、その音が葦ぶきの仮屋に届く情景。【文学的ポイント】聴覚的表現を重視し、秋の夕方の静謐と物寂しさを描く。'),
+    Poem(id=72, author='祐子内親王家紀伊', upper='音に聞く 高師の浜の あだ波は', lower='かけじや袖の ぬれもこそすれ', reading_upper='おとにきく たかしのはまの あだなみは', reading_lower='かけじやそでの ぬれもこそすれ', description='【出典】詞花和歌集『恋』701番。【背景・情景】噂に聞く高師浜の荒波のように、浮気な人には関わらない方がよいと戒める恋歌。【文学的ポイント】地名「高師の浜」と荒波の性質を人の心に喩える巧みな比喩。'),
+    Poem(id=73, author='前中納言匡房', upper='高砂の 尾の上の桜 咲きにけり', lower='外山の霞 立たずもあらなむ', reading_upper='たかさごの おのえのさくら さきにけり', reading_lower='とやまのかすみ たたずもあらなん', description='【出典】金葉和歌集『春』70番。【背景・情景】高砂山の桜が咲いたが、外山に霞が立たないでほしいと願う、花をよく眺めたい気持ちを詠む。【文学的ポイント】花見の妨げとなる霞を排して花の美を楽しむ感情を率直に表す。'),
+    Poem(id=74, author='源俊頼朝臣', upper='憂かりける 人を初瀬の 山おろしよ', lower='はげしかれとは 祈らぬものを', reading_upper='うかりける ひとをはつせの やまおろしよ', reading_lower='はげしかれとは いのらぬものを', description='【出典】千載和歌集『恋』822番。【背景・情景】冷淡な人を、初瀬山の激しい山颪に喩え、自分はそんな激しさを願ったわけではないと嘆く。【文学的ポイント】山颪を恋の冷たさに掛ける比喩表現が特徴的。'),
+    Poem(id=75, author='藤原基俊', upper='契りおきし させもが露を 命にて', lower='あはれ今年の 秋もいぬめり', reading_upper='ちぎりおきし させもがつゆを いのちにて', reading_lower='あわれことしの あきもいぬめり', description='【出典】千載和歌集『恋』877番。【背景・情景】以前の約束や想いを命の糧としてきたが、その露のような希望も儚く消え、今年の秋も過ぎようとしていると詠む。【文学的ポイント】「させもが露」は恵みや希望の象徴。'),
+    Poem(id=76, author='法性寺入道前関白太政大臣', upper='わたの原 こぎいでて見れば 久方の', lower='雲居にまがふ 沖つ白波', reading_upper='わたのはら こぎいでてみれば ひさかたの', reading_lower='くもいにまごう おきつしらなみ', description='【出典】千載和歌集『雑』1031番。【背景・情景】海に漕ぎ出て遠くを見ると、沖の白波がまるで雲のように見える様子を描く。【文学的ポイント】遠近法的視点と比喩を用いた雄大な海景描写。'),
+    Poem(id=77, author='崇徳院', upper='瀬をはやみ 岩にせかるる 滝川の', lower='われても末に あはむとぞ思ふ', reading_upper='せをはやみ いわにせかるる たきがわの', reading_lower='われてもすえに あわんとぞおもう', description='【出典】詞花和歌集『恋』646番。【背景・情景】流れの早い瀬が岩に阻まれても、分かれて再び合流するように、離れても再会を願う恋心を詠む。【文学的ポイント】滝川の水流を恋の比喩とする技巧的歌。'),
+    Poem(id=78, author='源兼昌', upper='淡路島 かよふ千鳥の 鳴く声に', lower='いく夜寝ざめぬ 須磨の関守', reading_upper='あわじしま かようちどりの なくこえに', reading_lower='いくよねざめぬ すまのせきもり', description='【出典】詞花和歌集『冬』356番。【背景・情景】淡路島を行き来する千鳥の声に、須磨の関守が幾度も夜中に目を覚ます情景。【文学的ポイント】旅情と孤独感を千鳥の鳴き声に託す。'),
+    Poem(id=79, author='左京大夫顕輔', upper='秋風に たなびく雲の 絶え間より', lower='もれいづる月の 影のさやけさ', reading_upper='あきかぜに たなびくくもの たえまより', reading_lower='もれいずるつきの かげのさやけさ', description='【出典】金葉和歌集『秋』294番。【背景・情景】秋風に流れる雲の切れ間から月が差し込む、その光の清らかさを詠む。【文学的ポイント】光と影の対比が鮮やか。'),
+    Poem(id=80, author='待賢門院堀河', upper='長からむ 心も知らず 黒髪の', lower='乱れてけさは ものをこそ思へ', reading_upper='ながからん こころもしらず くろかみの', reading_lower='みだれてけさは ものをこそおもえ', description='【出典】千載和歌集『恋』839番。【背景・情景】長く続くはずの相手の心もわからず、黒髪のように乱れた思いで今朝は物思いに沈む恋心を詠む。【文学的ポイント】髪の乱れを心の乱れに重ねる古典的手法。'),
+    Poem(id=81, author='後徳大寺左大臣', upper='ほととぎす 鳴きつる方を ながむれば', lower='ただ有明の 月ぞ残れる', reading_upper='ほととぎす なきつるかたを ながむれば', reading_lower='ただありあけの つきぞのこれる', description='【出典】千載和歌集『夏』183番。【背景・情景】ほととぎすの声が聞こえた方を見やると、そこには夜明けの有明の月だけが残っていたという初夏の朝の情景。【文学的ポイント】ほととぎすの声と月明かりを取り合わせ、時間の移ろいを視覚と聴覚で表現。'),
+    Poem(id=82, author='道因法師', upper='思ひわび さても命は あるものを', lower='憂きにたへぬは 涙なりけり', reading_upper='おもいわび さてもいのちは あるものを', reading_lower='うきにたえぬは なみだなりけり', description='【出典】千載和歌集『恋』884番。【背景・情景】辛い恋に悩みつつも命はまだ続くが、その辛さに耐えきれないのは流れる涙であると詠む。【文学的ポイント】命と涙を対比させることで、恋の苦しみの深さを強調。'),
+    Poem(id=83, author='皇太后宮大夫俊成', upper='世の中よ 道こそなけれ 思ひ入る', lower='山の奥にも 鹿ぞ鳴くなる', reading_upper='よのなかよ みちこそなけれ おもいいる', reading_lower='やまのおくにも しかぞなくなる', description='【出典】千載和歌集『雑』1047番。【背景・情景】世の中に逃げ場はなく、心を慰めるため山奥に入っても、鹿の鳴き声が物寂しさを増すだけという嘆き。【文学的ポイント】鹿の声を孤独の象徴として用い、逃避の無意味さを示す。'),
+    Poem(id=84, author='藤原清輔朝臣', upper='長らへば またこのごろや しのばれむ', lower='憂しと見し世ぞ 今は恋しき', reading_upper='ながらえば またこのごろや しのばれん', reading_lower='うしとみしよぞ いまはこいしき', description='【出典】千載和歌集『雑』1003番。【背景・情景】長く生きれば、今は辛いと感じるこの時期も、やがて懐かしく思い出される日が来るだろうという感慨。【文学的ポイント】時間の経過が価値観を変えるという普遍的なテーマを詠む。'),
+    Poem(id=85, author='俊恵法師', upper='夜もすがら 秋風聞きつ けの袖に', lower='霜は置きつつ ものをこそ思へ', reading_upper='よもすがら あきかぜききつ けのそでに', reading_lower='しもはおきつつ ものをこそおもえ', description='【出典】千載和歌集『恋』882番。【背景・情景】一晩中秋風を聞きながら、着物の袖には霜が降りるほどじっと物思いにふける情景。【文学的ポイント】季節感と恋の物思いを結びつける古典的手法。'),
+    Poem(id=86, author='西行法師', upper='嘆けとて 月やは物を 思はする', lower='かこち顔なる わが涙かな', reading_upper='なげけとて つきやはものを おもわする', reading_lower='かこちがおなる わがなみだかな', description='【出典】千載和歌集『恋』881番。【背景・情景】月が嘆けと命じているわけではないのに、月を恨めしく見つめながら涙する自分を描く恋の嘆き。【文学的ポイント】擬人化と独白的な口調が情感を高める。'),
+    Poem(id=87, author='寂蓮法師', upper='村雨の 露もまだひぬ 槇の葉に', lower='霧立ちのぼる 秋の夕暮れ', reading_upper='むらさめの つゆもまだひぬ まきのはに', reading_lower='きりたちのぼる あきのゆうぐれ', description='【出典】新古今和歌集『秋』401番。【背景・情景】にわか雨の露がまだ乾かない槙の葉から、霧が立ちのぼる秋の夕暮れの情景。【文学的ポイント】視覚的な移ろいを短い時間で描き出す写生的技法。'),
+    Poem(id=88, author='皇嘉門院別当', upper='難波江の 蘆のかりねの ひとよゆゑ', lower='身をつくしてや 恋ひわたるべき', reading_upper='なにわえの あしのかりねの ひとよゆえ', reading_lower='みをつくしてや こいわたるべき', description='【出典】千載和歌集『恋』877番。【背景・情景】難波江の葦の仮寝の一夜のような短い契りのために、一生をかけて恋い続けるのかという切ない恋心。【文学的ポイント】地名歌枕と掛詞（葦・仮寝・身を尽くす）を巧みに用いる。'),
+    Poem(id=89, author='式子内親王', upper='玉の緒よ 絶えなば絶えね ながらへば', lower='忍ぶることの 弱りもぞする', reading_upper='たまのおよ たえなばたえね ながらえば', reading_lower='しのぶることの よわりもぞする', description='【出典】新古今和歌集『恋』901番。【背景・情景】命よ、絶えるなら絶えてほしい。生き長らえると、忍んできた心が弱まってしまうかもしれないという恋の極限的心情。【文学的ポイント】命の糸を玉の緒に喩える伝統的比喩。'),
+    Poem(id=90, author='殷富門院大輔', upper='見せばやな 雄島のあまの 袖だにも', lower='ぬれにぞぬれし 色は変はらず', reading_upper='みせばやな おじまのあまの そでだにも', reading_lower='ぬれにぞぬれし いろはかわらず', description='【出典】千載和歌集『恋』890番。【背景・情景】雄島の海人の袖すら濡れるが色は変わらない。それと同じように、涙に濡れても変わらぬ我が恋心を見せたいという情熱的な歌。【文学的ポイント】誇張と比喩による恋の一途さの強調。'),
+    Poem(id=91, author='後京極摂政前太政大臣', upper='きりぎりす 鳴くや霜夜の さむしろに', lower='衣かたしき ひとりかも寝む', reading_upper='きりぎりす なくやしもよの さむしろに', reading_lower='ころもかたしき ひとりかもねん', description='【出典】新古今和歌集『冬』541番。【背景・情景】霜の降る寒い夜、きりぎりすが鳴く中で、片方だけ敷いた衣の上に一人寂しく寝る様子。【文学的ポイント】秋から冬への移ろいと孤独感を虫の音で表現。'),
+    Poem(id=92, author='二条院讃岐', upper='わが袖は 潮干に見えぬ 沖の石の', lower='人こそ知らね 乾く間もなし', reading_upper='わがそでは しおひにみえぬ おきのいしの', reading_lower='ひとこそしらね かわくまもなし', description='【出典】千載和歌集『恋』894番。【背景・情景】潮が引いても現れない沖の石のように、人には見えないが、涙に濡れて袖が乾く間もない我が恋心。【文学的ポイント】見えない沖の石を秘めた恋の象徴とする比喩。'),
+    Poem(id=93, author='鎌倉右大臣', upper='世の中は 常にもがもな 渚こぐ', lower='あまの小舟の 綱手かなしも', reading_upper='よのなかは つねにもがもな なぎさこぐ', reading_lower='あまのおぶねの つなでかなしも', description='【出典】新古今和歌集『雑』1023番。【背景・情景】世の中が常に変わらず穏やかであってほしいと願いながら、渚を漕ぐ海人の小舟の綱手を美しいと眺める。【文学的ポイント】漁の情景を平和な世への願いに重ねる。'),
+    Poem(id=94, author='参議雅経', upper='み吉野の 山の秋風 小夜更けて', lower='ふるさと寒く 衣打つなり', reading_upper='みよしのの やまのあきかぜ さよふけて', reading_lower='ふるさとさむく ころもうつなり', description='【出典】新古今和歌集『冬』546番。【背景・情景】吉野の山から秋風が吹き、夜も更けて故郷は寒く、衣を打つ音が響くという冬支度の情景。【文学的ポイント】音（衣打ち）で季節感を伝える典雅な技巧。'),
+    Poem(id=95, author='前大僧正慈円', upper='おほけなく うき世の民に おほふかな', lower='わが立つ杣に すみぞめの袖', reading_upper='おおけなく うきよのたみに おおうかな', reading_lower='わがたつそまに すみぞめのそで', description='【出典】新古今和歌集『雑』1061番。【背景・情景】身分を超え、世の人々を仏の慈悲で包もうとする僧の心を、僧衣の墨染めの袖に託して詠む。【文学的ポイント】宗教的理想と謙虚さを備えた歌。'),
+    Poem(id=96, author='入道前太政大臣', upper='花さそふ 嵐の庭の 雪ならで', lower='ふりゆくものは わが身なりけり', reading_upper='はなさそう あらしのにわの ゆきならで', reading_lower='ふりゆくものは わがみなりけり', description='【出典】新古今和歌集『春』174番。【背景・情景】花を散らす嵐の庭に雪が降るのではなく、年老いていく我が身こそが降りゆくのだと詠む晩年の感慨。【文学的ポイント】自然現象と人生を重ねる象徴的表現。'),
+    Poem(id=97, author='権中納言定家', upper='こぬ人を まつほの浦の 夕なぎに', lower='焼くや藻塩の 身もこがれつつ', reading_upper='こぬひとを まつほのうらの ゆうなぎに', reading_lower='やくやもしおの みもこがれつつ', description='【出典】新古今和歌集『恋』934番。【背景・情景】待つ人が来ない松帆の浦で、夕凪の中、藻塩を焼く煙のように、恋焦がれる我が身を詠む。【文学的ポイント】地名歌枕（松帆の浦）と掛詞（待つ・松）を用いた技巧派歌。'),
+    Poem(id=98, author='従二位家隆', upper='風そよぐ ならの小川の 夕暮は', lower='みそぎぞ夏の しるしなりける', reading_upper='かぜそよぐ ならのおがわの ゆうぐれは', reading_lower='みそぎぞなつの しるしなりける', description='【出典】新古今和歌集『夏』197番。【背景・情景】風がそよぐ奈良の小川の夕暮れ、夏越の祓の禊こそが夏の訪れの印だと詠む。【文学的ポイント】宗教儀礼を季節の指標として描く清涼感ある歌。'),
+    Poem(id=99, author='後鳥羽院', upper='人もをし 人も恨めし あぢきなく', lower='世を思ふゆゑに 物思ふ身は', reading_upper='ひともおし ひともらめし あじきなく', reading_lower='よをおもうゆえに ものおもうみは', description='【出典】新古今和歌集『雑』1049番。【背景・情景】人も愛しく恨めしく感じ、世の中をあぢきないと嘆く、思索的で複雑な心情。【文学的ポイント】相反する感情を同時に表す心理的リアリズム。'),
+    Poem(id=100, author='順徳院', upper='百敷や 古き軒端の しのぶにも', lower='なほ余りある 昔なりけり', reading_upper='ももしきや ふるきのきばの しのぶにも', reading_lower='なおあまりある むかしなりけり', description='【出典】新古今和歌集『雑』1037番。【背景・情景】宮中の古い軒端の忍草を見て、なお尽きぬほど懐かしい昔を偲ぶ。【文学的ポイント】宮廷の象徴「百敷」と忍草を用い、時間の流れと郷愁を表現。'),
+)
@@ -4,37 +4,82 @@
 import random
 import sys
 import os
+from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterable, Set
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # インポート
 from modules.models import (
-    Question, QuizSession, QuizMode, QuestionType,
+    Poem, Question, QuizSession, QuizMode, QuestionType,
     QUESTION_PATTERNS, QuizConfig
 )
 from modules.data_loader import DataLoader
 
+# 頻繁に参照する列挙値（毎回の列挙型属性参照を避ける）
+_SEQUENTIAL = QuizMode.SEQUENTIAL
+_RANDOM = QuizMode.RANDOM
+_DEFAULT_QTYPE = QuestionType.LOWER_MATCH.value
+
+# 問題から歌IDを取り出す関数
+_POEM_ID = attrgetter('poem_id')
+
+
+def _first_unused(candidates: Iterable, used_ids: Set[int], key=None):
+    """
+    候補を順に調べ、使用済みでない最初の候補を返す（出題の選択規則を一箇所にまとめる）
+    
+    Args:
+        candidates: 出題順に並んだ候補（歌IDまたは問題）
+        used_ids: 使用済み歌IDの集合
+        key: 候補から歌IDを取り出す関数（省略時は候補そのものを歌IDとする）
+        
+    Returns:
+        使用済みでない最初の候補、なければNone
+    """
+    if key is None:
+        return next((c for c in candidates if c not in used_ids), None)
+    return next((c for c in candidates if key(c) not in used_ids), None)
+
 
 class QuizManager:
     """クイズのロジックを管理するクラス"""
     
-    def __init__(self, data_loader: DataLoader):
+    def __init__(self, data_loader: DataLoader, rng: Optional[random.Random] = None):
         """
         初期化
         
         Args:
             data_loader: データローダーのインスタンス
+            rng: 乱数生成器（省略時はrandomモジュールの共有インスタンス、テストでの再現用）
         """
         self.data_loader = data_loader
         self.poems = data_loader.get_all_poems()
         self.poem_count = data_loader.get_poem_count()
         
+        # 乱数関数を属性として保持（呼び出しごとのモジュール属性参照を避ける）
+        source = rng if rng is not None else random
+        self._choice = source.choice
+        self._sample = source.sample
+        self._randint = source.randint
+        self._poem_by_id: Dict[int, Poem] = {poem.id: poem for poem in self.poems}
+        self._all_ids = frozenset(self._poem_by_id)
+        self._id_list = list(self._poem_by_id)
+        
+        # 正解フィールドごとの値の取得関数と、重複を除いた選択肢の候補を事前に構築
+        correct_fields = {pattern['correct_field'] for pattern in QUESTION_PATTERNS.values()}
+        self._field_getters = {field: attrgetter(field) for field in correct_fields}
+        self._field_values: Dict[str, List[str]] = {
+            field: list(dict.fromkeys(map(getter, self.poems)))
+            for field, getter in self._field_getters.items()
+        }
+        
     def generate_question(self, 
-                         poem: Dict, 
-                         question_type: str = QuestionType.LOWER_MATCH.value) -> Question:
+                         poem: Poem, 
+                         question_type: str = _DEFAULT_QTYPE) -> Question:
         """
         指定された歌と問題タイプから問題を生成する
         
@@ -51,29 +96,26 @@ class QuizManager:
             raise ValueError(f"不正な問題タイプ: {question_type}")
         
         # 問題文を生成
-        question_text = self._format_question_text(poem, pattern['question'])
+        question_text = self._format_question_text(poem, pattern)
         
         # 正解を取得
-        correct_answer = poem[pattern['correct_field']]
+        field = pattern['correct_field']
+        correct_answer = self._field_getters[field](poem)
         
         # 不正解の選択肢を生成（3つ）
-        wrong_options = self.get_wrong_options(poem, question_type, 3)
-        
-        # 選択肢を作成（正解＋不正解3つ）
-        options = [correct_answer] + wrong_options
+        wrong_options = self._get_wrong_options(field, correct_answer, 3)
         
-        # 選択肢をシャッフル
-        random.shuffle(options)
-        
-        # 正解のインデックスを取得
-        correct_answer_index = options.index(correct_answer)
+        # 不正解の選択肢はランダムな順序なので、正解をランダムな位置に挿入する
+        correct_answer_index = self._randint(0, len(wrong_options))
+        options = list(wrong_options)
+        options.insert(correct_answer_index, correct_answer)
         
         # Questionオブジェクトを作成
         question = Question(
-            poem_id=poem['id'],
+            poem_id=poem.id,
             question_type=question_type,
             question_text=question_text,
-            options=options,
+            options=tuple(options),
             correct_answer_index=correct_answer_index,
             poem_data=poem
         )
@@ -81,7 +123,7 @@ class QuizManager:
         return question
     
     def get_wrong_options(self, 
-                         correct_poem: Dict, 
+                         correct_poem: Poem, 
                          question_type: str, 
                          count: int = 3) -> List[str]:
         """
@@ -100,33 +142,30 @@ class QuizManager:
             raise ValueError(f"不正な問題タイプ: {question_type}")
         
         field = pattern['correct_field']
+        return self._get_wrong_options(field, self._field_getters[field](correct_poem), count)
+    
+    def _get_wrong_options(self, 
+                          field: str, 
+                          correct_answer: str, 
+                          count: int = 3) -> List[str]:
+        """
+        正解フィールドを指定して不正解の選択肢を生成する
         
-        # 正解以外の歌から選択肢を抽出
-        other_poems = [p for p in self.poems if p['id'] != correct_poem['id']]
-        
-        # 重複を避けるために選択肢を集合で管理
-        wrong_options = set()
-        
-        # ランダムに選択
-        random.shuffle(other_poems)
-        
-        for poem in other_poems:
-            option = poem[field]
-            # 正解と同じでなく、まだ追加されていない選択肢を追加
-            if option != correct_poem[field] and option not in wrong_options:
-                wrong_options.add(option)
-                if len(wrong_options) >= count:
-                    break
-        
-        # 必要数に満たない場合の処理（通常は発生しない）
-        if len(wrong_options) < count:
-            # 同じフィールドから重複を許可して追加
-            for poem in other_poems:
-                if len(wrong_options) >= count:
-                    break
-                wrong_options.add(poem[field])
+        Args:
+            field: 選択肢にする項目名（upper/lower/author）
+            correct_answer: 正解の値
+            count: 生成する選択肢の数
+            
+        Returns:
+            不正解選択肢のリスト
+        """
+        # 重複のない候補から1つ多く選び、正解が含まれていれば取り除く
+        pool = self._field_values[field]
+        wrong_options = self._sample(pool, min(count + 1, len(pool)))
+        if correct_answer in wrong_options:
+            wrong_options.remove(correct_answer)
         
-        return list(wrong_options)[:count]
+        return wrong_options[:count]
     
     def check_answer(self, question: Question, selected_index: int) -> bool:
         """
@@ -144,7 +183,7 @@ class QuizManager:
     def get_next_poem(self, 
                      mode: QuizMode, 
                      current_index: int, 
-                     used_ids: List[int]) -> Optional[Dict]:
+                     used_ids: Iterable[int]) -> Optional[Poem]:
         """
         次の歌を取得する
         
@@ -156,21 +195,23 @@ class QuizManager:
         Returns:
             次の歌のデータ
         """
-        if mode == QuizMode.SEQUENTIAL:
-            # 順番モード
-            next_id = current_index + 1
-            if next_id > self.poem_count:
+        if mode == _SEQUENTIAL:
+            # 順番モード（現在位置の次から、使用済みの歌を飛ばす）
+            if not isinstance(used_ids, (set, frozenset)):
+                used_ids = set(used_ids)
+            next_id = _first_unused(range(current_index + 1, self.poem_count + 1), used_ids)
+            if next_id is None:
                 return None
-            return self.data_loader.get_poem_by_id(next_id)
+            return self._poem_by_id.get(next_id)
         
-        elif mode == QuizMode.RANDOM:
+        elif mode == _RANDOM:
             # ランダムモード
-            available_ids = [p['id'] for p in self.poems if p['id'] not in used_ids]
+            available_ids = self._all_ids.difference(used_ids)
             if not available_ids:
                 return None
             
-            next_id = random.choice(available_ids)
-            return self.data_loader.get_poem_by_id(next_id)
+            next_id = self._choice(list(available_ids))
+            return self._poem_by_id.get(next_id)
         
         return None
     
@@ -189,8 +230,41 @@ class QuizManager:
             question_types=config.question_types,
             max_questions=min(config.max_questions, self.poem_count)
         )
+        
+        # 出題する問題をまとめて事前生成する（再描画のたびに生成しない）
+        if session.question_types:
+            session.set_pending_questions(self._generate_questions(session))
         return session
     
+    def _generate_questions(self, session: QuizSession) -> List[Question]:
+        """
+        セッションの全問題を一括生成する
+        
+        Args:
+            session: クイズセッション
+            
+        Returns:
+            出題順に並んだ問題のリスト
+        """
+        count = session.max_questions
+        if session.quiz_mode == _SEQUENTIAL:
+            # 逐次生成と同じ順序になるよう、get_next_poemで先頭から順に求める
+            poems = []
+            for index in range(count):
+                poem = self.get_next_poem(_SEQUENTIAL, index, ())
+                if poem is None:
+                    break
+                poems.append(poem)
+        elif session.quiz_mode == _RANDOM:
+            poem_by_id = self._poem_by_id
+            poems = [poem_by_id[poem_id] for poem_id in self._sample(self._id_list, count)]
+        else:
+            return []
+        
+        choice = self._choice
+        question_types = session.question_types
+        return [self.generate_question(poem, choice(question_types)) for poem in poems]
+    
     def generate_next_question(self, session: QuizSession) -> Optional[Question]:
         """
         セッションの次の問題を生成する
@@ -201,52 +275,55 @@ class QuizManager:
         Returns:
             生成された問題、生成できない場合None
         """
+        # 事前生成済みの問題があればそれを出題する（使用済みの歌は逐次生成と同じく飛ばす）
+        used_ids = session.get_used_poem_id_set()
+        question = _first_unused(iter(session.pop_pending_question, None), used_ids, _POEM_ID)
+        if question is not None:
+            session.mark_poem_used(question.poem_id)
+            return session.add_question(question)
+        
         # 次の歌を取得
-        if session.quiz_mode == QuizMode.SEQUENTIAL:
+        if session.quiz_mode == _SEQUENTIAL:
+            # 位置は出題済みの問題数で決める（集合は存在確認にのみ使う）
             next_poem = self.get_next_poem(
                 session.quiz_mode,
-                len(session.used_poem_ids),
-                session.used_poem_ids
+                len(session.questions),
+                used_ids
             )
         else:
             next_poem = self.get_next_poem(
                 session.quiz_mode,
                 session.current_question_index,
-                session.used_poem_ids
+                used_ids
             )
         
         if not next_poem:
             return None
         
         # 問題タイプをランダムに選択（複数タイプが設定されている場合）
-        question_type = random.choice(session.question_types)
+        question_type = self._choice(session.question_types)
         
         # 問題を生成
         question = self.generate_question(next_poem, question_type)
         
-        # セッションに追加
-        session.used_poem_ids.append(next_poem['id'])
-        session.add_question(question)
+        # セッションに追加（問題番号を付けた問題に置き換わる）
+        session.mark_poem_used(next_poem.id)
+        question = session.add_question(question)
         
         return question
     
-    def _format_question_text(self, poem: Dict, template: str) -> str:
+    def _format_question_text(self, poem: Poem, pattern: Dict) -> str:
         """
-        問題文テンプレートをフォーマットする
+        問題文を生成する
         
         Args:
             poem: 歌データ
-            template: 問題文テンプレート
+            pattern: 問題パターン
             
         Returns:
             フォーマットされた問題文
         """
-        return template.format(
-            upper=poem.get('upper', ''),
-            lower=poem.get('lower', ''),
-            author=poem.get('author', ''),
-            id=poem.get('id', '')
-        )
+        return pattern['formatter'](poem)
     
     def get_question_statistics(self, session: QuizSession) -> Dict:
         """
@@ -258,28 +335,22 @@ class QuizManager:
         Returns:
             統計情報
         """
-        stats = {
-            'total': len(session.questions),
-            'by_type': {},
-            'correct_by_type': {}
-        }
+        # 正解かどうかは回答済みの場合のみチェック
+        answered_index = session.current_answer if session.is_answered else None
         
-        # 問題タイプ別にカウント
+        # 問題タイプ別に1回の走査でカウント
+        correct_by_type = defaultdict(lambda: {'correct': 0, 'total': 0})
         for question in session.questions:
-            q_type = question.question_type
-            if q_type not in stats['by_type']:
-                stats['by_type'][q_type] = 0
-                stats['correct_by_type'][q_type] = {'correct': 0, 'total': 0}
-            
-            stats['by_type'][q_type] += 1
-            stats['correct_by_type'][q_type]['total'] += 1
-            
-            # 正解かどうかチェック（回答済みの場合）
-            if session.is_answered and session.current_answer is not None:
-                if question.check_answer(session.current_answer):
-                    stats['correct_by_type'][q_type]['correct'] += 1
+            type_stats = correct_by_type[question.question_type]
+            type_stats['total'] += 1
+            if answered_index is not None and question.check_answer(answered_index):
+                type_stats['correct'] += 1
         
-        return stats
+        return {
+            'total': len(session.questions),
+            'by_type': {q_type: type_stats['total'] for q_type, type_stats in correct_by_type.items()},
+            'correct_by_type': dict(correct_by_type)
+        }
     
     def get_random_question_type(self, available_types: List[str]) -> str:
         """
@@ -292,8 +363,8 @@ class QuizManager:
             選択された問題タイプ
         """
         if not available_types:
-            return QuestionType.LOWER_MATCH.value
-        return random.choice(available_types)
+            return _DEFAULT_QTYPE
+        return self._choice(available_types)
 
 
 # テスト用のメイン処理
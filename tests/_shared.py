@@ -0,0 +1,28 @@
+"""
+テスト間で共有する補助関数
+"""
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.data_loader import DataLoader
+
+
+@lru_cache(maxsize=1)
+def get_loader() -> DataLoader:
+    """テスト用のデータローダーを取得（プロセス内で一度だけ読み込む）"""
+    return DataLoader()
+
+
+# TEST_VERBOSE環境変数が設定されている場合のみ各テストの経過を表示する
+VERBOSE = bool(os.environ.get("TEST_VERBOSE"))
+
+
+def log(message: str) -> None:
+    """テストの経過を表示（TEST_VERBOSE設定時のみ）"""
+    if VERBOSE:
+        print(message)
@@ -0,0 +1,16 @@
+"""
+pytest用の共通フィクスチャ
+
+テストはunittestで書かれているが、pytest（pytest-xdistを含む）で実行した場合も
+データの読み込みをプロセスごとに一度で済ませるためのフィクスチャを提供する。
+unittestでの実行時には読み込まれない。
+"""
+import pytest
+
+from tests._shared import get_loader
+
+
+@pytest.fixture(scope="session")
+def loader():
+    """データローダー（プロセス内で共有）"""
+    return get_loader()
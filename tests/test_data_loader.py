@@ -10,53 +10,74 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from modules.data_loader import DataLoader
+from tests._shared import VERBOSE, log
 
 
 class TestDataLoader(unittest.TestCase):
     """DataLoaderクラスのテストケース"""
     
-    def setUp(self):
-        """各テストの前処理"""
-        self.loader = None
+    @classmethod
+    def setUpClass(cls):
+        """テストクラスの初期化（一度だけ実行）"""
+        cls.loader = DataLoader()
         
     def test_data_loading_success(self):
         """正常なデータ読み込みのテスト"""
         try:
-            self.loader = DataLoader()
-            self.assertIsNotNone(self.loader.data)
-            self.assertIsInstance(self.loader.data, list)
-            print(f"✓ データ読み込み成功: {len(self.loader.data)}首")
+            loader = DataLoader()
+            self.assertIsNotNone(loader.data)
+            self.assertIsInstance(loader.data, list)
+            log(f"✓ データ読み込み成功: {len(loader.data)}首")
         except Exception as e:
             self.fail(f"データ読み込みに失敗: {e}")
     
+    def test_prebuilt_data_matches_json(self):
+        """生成済みモジュールのデータがJSONと一致するかのテスト"""
+        prebuilt = DataLoader()
+        from_json = DataLoader(use_prebuilt=False)
+        
+        self.assertEqual(prebuilt.data, from_json.data,
+                         "modules/poems_data.py が古い可能性があります（tools/gen_poems.py を再実行してください）")
+        log("✓ 生成済みデータとJSONが一致")
+    
     def test_get_poem_by_id(self):
         """ID指定による歌取得のテスト"""
-        self.loader = DataLoader()
-        
         # 正常なID指定
         poem = self.loader.get_poem_by_id(1)
         self.assertIsNotNone(poem)
         self.assertEqual(poem['id'], 1)
-        print(f"✓ ID=1の歌取得成功: {poem['author']}")
+        log(f"✓ ID=1の歌取得成功: {poem['author']}")
         
         # 存在しないID
         poem = self.loader.get_poem_by_id(999)
         self.assertIsNone(poem)
-        print("✓ 存在しないIDの処理正常")
+        log("✓ 存在しないIDの処理正常")
     
     def test_get_all_poems(self):
         """全歌取得のテスト"""
-        self.loader = DataLoader()
         poems = self.loader.get_all_poems()
         
         self.assertIsInstance(poems, list)
         self.assertEqual(len(poems), self.loader.get_poem_count())
-        print(f"✓ 全歌取得成功: {len(poems)}首")
+        log(f"✓ 全歌取得成功: {len(poems)}首")
+    
+    def test_poem_access(self):
+        """歌データの属性アクセスと辞書形式アクセスのテスト"""
+        poem = self.loader.get_poem_by_id(1)
+        
+        # 属性と辞書形式で同じ値が取得できるか
+        for field in ('id', 'author', 'upper', 'lower'):
+            self.assertEqual(poem[field], getattr(poem, field))
+        self.assertEqual(poem.get('reading_upper'), poem.reading_upper)
+        self.assertIsNone(poem.get('unknown_field'))
+        
+        # 存在しない項目はKeyError
+        with self.assertRaises(KeyError):
+            poem['unknown_field']
+        log("✓ 歌データのアクセス正常")
     
     def test_get_random_poems(self):
         """ランダム歌取得のテスト"""
-        self.loader = DataLoader()
-        
         # 3首をランダムに取得
         random_poems = self.loader.get_random_poems(3)
         self.assertEqual(len(random_poems), 3)
@@ -65,34 +86,29 @@ class TestDataLoader(unittest.TestCase):
         random_poems_exclude = self.loader.get_random_poems(3, exclude_id=1)
         ids = [poem['id'] for poem in random_poems_exclude]
         self.assertNotIn(1, ids)
-        print(f"✓ ランダム取得成功: {len(random_poems)}首")
+        log(f"✓ ランダム取得成功: {len(random_poems)}首")
     
     def test_data_validation(self):
         """データ検証のテスト"""
-        self.loader = DataLoader()
-        
         # 必須フィールドの確認
-        required_fields = ['id', 'author', 'upper', 'lower']
+        required_fields = ('id', 'author', 'upper', 'lower')
         for poem in self.loader.data[:5]:  # 最初の5首をテスト
             for field in required_fields:
-                self.assertIn(field, poem)
+                self.assertIn(field, poem._fields)
                 self.assertIsNotNone(poem[field])
         
-        print("✓ データ検証成功")
+        log("✓ データ検証成功")
     
     def test_get_authors(self):
         """作者一覧取得のテスト"""
-        self.loader = DataLoader()
         authors = self.loader.get_authors()
         
         self.assertIsInstance(authors, list)
         self.assertGreater(len(authors), 0)
-        print(f"✓ 作者一覧取得成功: {len(authors)}人")
+        log(f"✓ 作者一覧取得成功: {len(authors)}人")
     
     def test_get_poems_by_author(self):
         """作者別歌取得のテスト"""
-        self.loader = DataLoader()
-        
         # 最初の歌の作者で検索
         first_poem = self.loader.get_poem_by_id(1)
         if first_poem:
@@ -106,7 +122,7 @@ class TestDataLoader(unittest.TestCase):
             for poem in poems:
                 self.assertEqual(poem['author'], author)
             
-            print(f"✓ 作者「{author}」の歌取得成功: {len(poems)}首")
+            log(f"✓ 作者「{author}」の歌取得成功: {len(poems)}首")
 
 
 def run_tests():
@@ -119,7 +135,8 @@ def run_tests():
     suite = unittest.TestLoader().loadTestsFromTestCase(TestDataLoader)
     
     # テストの実行
-    runner = unittest.TextTestRunner(verbosity=2)
+    # 経過表示を有効にしていない場合、成功したテストの出力は表示しない
+    runner = unittest.TextTestRunner(verbosity=2, buffer=not VERBOSE)
     result = runner.run(suite)
     
     print("\n" + "=" * 50)
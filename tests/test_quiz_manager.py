@@ -2,44 +2,68 @@
 QuizManagerクラスのユニットテスト
 """
 import unittest
+import random
 import sys
 import os
 from pathlib import Path
-from collections import Counter
+
+import numpy as np
+
+# concurrencytestが利用可能ならテストを複数プロセスで並列実行する（なければ逐次実行）
+try:
+    from concurrencytest import ConcurrentTestSuite, fork_for_tests
+except ImportError:
+    ConcurrentTestSuite = None
 
 # プロジェクトのルートディレクトリをパスに追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from modules.quiz_manager import QuizManager
-from modules.data_loader import DataLoader
+from tests._shared import get_loader, VERBOSE, log
 from modules.models import (
     QuizMode, QuestionType, QUESTION_PATTERNS, QuizConfig, QuizSession
 )
 
 
+# 問題タイプの値（テスト内で繰り返し列挙型を参照しないよう定数化）
+_Q_LOWER = QuestionType.LOWER_MATCH.value
+_Q_UPPER = QuestionType.UPPER_MATCH.value
+_Q_AUTHOR = QuestionType.AUTHOR_MATCH.value
+_Q_POEM_BY_AUTHOR = QuestionType.POEM_BY_AUTHOR.value
+_ALL_Q = (_Q_LOWER, _Q_UPPER, _Q_AUTHOR, _Q_POEM_BY_AUTHOR)
+
+# 全歌番号（1-100）
+_ALL_POEM_IDS = tuple(range(1, 101))
+
+# 問題タイプごとの表示名と正解フィールド（テスト内で繰り返し引かないよう事前に展開）
+_DISPLAY_NAMES = {q_type: pattern['display_name'] for q_type, pattern in QUESTION_PATTERNS.items()}
+_CORRECT_FIELDS = {q_type: pattern['correct_field'] for q_type, pattern in QUESTION_PATTERNS.items()}
+
+
 class TestQuizManager(unittest.TestCase):
     """QuizManagerクラスのテストケース"""
     
     @classmethod
     def setUpClass(cls):
         """テストクラスの初期化（一度だけ実行）"""
-        cls.loader = DataLoader()
-        cls.manager = QuizManager(cls.loader)
+        cls.loader = get_loader()
+        # 乱数を固定して結果を再現可能にする
+        cls.manager = QuizManager(cls.loader, rng=random.Random(0))
+        cls.all_poems = [cls.loader.get_poem_by_id(i) for i in _ALL_POEM_IDS]
+        # 下の句当ての問題を全首分生成しておき、複数のテストで使い回す
+        cls.lower_questions = [cls.manager.generate_question(poem, _Q_LOWER) for poem in cls.all_poems]
         
     def test_initialization(self):
         """初期化のテスト"""
         self.assertIsNotNone(self.manager)
         self.assertEqual(self.manager.poem_count, 100)
-        print("✓ QuizManager初期化成功")
+        log("✓ QuizManager初期化成功")
     
     def test_generate_question_all_types(self):
         """全問題タイプの生成テスト"""
         test_poem = self.loader.get_poem_by_id(1)
         
-        for q_type in [QuestionType.LOWER_MATCH.value,
-                      QuestionType.UPPER_MATCH.value,
-                      QuestionType.AUTHOR_MATCH.value,
-                      QuestionType.POEM_BY_AUTHOR.value]:
+        for q_type in _ALL_Q:
             
             with self.subTest(question_type=q_type):
                 question = self.manager.generate_question(test_poem, q_type)
@@ -54,59 +78,49 @@ class TestQuizManager(unittest.TestCase):
                 correct_answer = question.get_correct_answer()
                 self.assertIn(correct_answer, question.options)
                 
-                print(f"✓ {QUESTION_PATTERNS[q_type]['display_name']}の生成成功")
+                log(f"✓ {_DISPLAY_NAMES[q_type]}の生成成功")
     
     def test_no_duplicate_options(self):
-        """選択肢の重複チェック"""
-        # 100回テストして重複がないことを確認
-        for i in range(100):
-            poem = self.loader.get_poem_by_id((i % 100) + 1)
-            question = self.manager.generate_question(
-                poem, 
-                QuestionType.LOWER_MATCH.value
-            )
-            
-            # 選択肢に重複がないか確認
-            self.assertEqual(len(question.options), len(set(question.options)),
-                           f"選択肢に重複があります: {question.options}")
+        """選択肢の重複と正解位置のランダム性のテスト"""
+        # 全100首でテストして重複がないことを確認
+        questions = self.lower_questions
+        test_count = len(questions)
         
-        print("✓ 100回のテストで選択肢の重複なし")
-    
-    def test_correct_answer_randomness(self):
-        """正解位置のランダム性テスト"""
-        positions = []
-        test_count = 100
+        # 選択肢に重複がないか確認（全問題の選択肢数をまとめて比較）
+        option_counts = np.fromiter((len(q.options) for q in questions), dtype=np.int8, count=test_count)
+        unique_counts = np.fromiter((len(set(q.options)) for q in questions), dtype=np.int8, count=test_count)
+        duplicated = np.flatnonzero(option_counts != unique_counts)
+        self.assertEqual(duplicated.size, 0,
+                         f"選択肢に重複があります: {[questions[i].options for i in duplicated]}")
         
-        # 同じ歌で複数回問題を生成
-        test_poem = self.loader.get_poem_by_id(1)
+        log("✓ 100回のテストで選択肢の重複なし")
         
-        for _ in range(test_count):
-            question = self.manager.generate_question(
-                test_poem,
-                QuestionType.LOWER_MATCH.value
-            )
-            positions.append(question.correct_answer_index)
+        # 正解位置の分布を確認（重複チェックで生成した問題を流用）
+        # 各位置（0-3）が少なくとも10%以上出現することを確認
+        positions = np.fromiter((q.correct_answer_index for q in questions), dtype=np.int8, count=test_count)
+        position_counts = np.bincount(positions, minlength=4)
+        self.assertTrue((position_counts > test_count * 0.10).all(),
+                        f"出現率が低すぎる位置があります: {position_counts.tolist()}")
         
-        # 正解位置の分布を確認
-        position_counts = Counter(positions)
+        log(f"✓ 正解位置の分布: {dict(enumerate(position_counts.tolist()))}")
+    
+    def test_rng_injection(self):
+        """乱数生成器を指定した場合に同じ問題が再現されるかのテスト"""
+        first = QuizManager(self.loader, rng=random.Random(42))
+        second = QuizManager(self.loader, rng=random.Random(42))
         
-        # 各位置（0-3）が少なくとも10%以上出現することを確認
-        for position in range(4):
-            count = position_counts.get(position, 0)
-            percentage = (count / test_count) * 100
-            self.assertGreater(percentage, 10,
-                             f"位置{position}の出現率が低すぎます: {percentage:.1f}%")
+        for poem in self.all_poems[:10]:
+            self.assertEqual(first.generate_question(poem, _Q_AUTHOR),
+                             second.generate_question(poem, _Q_AUTHOR))
         
-        print(f"✓ 正解位置の分布: {dict(position_counts)}")
+        log("✓ 乱数生成器の指定による再現正常")
     
     def test_wrong_options_generation(self):
         """不正解選択肢生成のテスト"""
         test_poem = self.loader.get_poem_by_id(50)
         
         # 各問題タイプで不正解選択肢を生成
-        for q_type in [QuestionType.LOWER_MATCH.value,
-                      QuestionType.UPPER_MATCH.value,
-                      QuestionType.AUTHOR_MATCH.value]:
+        for q_type in _ALL_Q[:3]:
             
             wrong_options = self.manager.get_wrong_options(test_poem, q_type, 3)
             
@@ -114,69 +128,106 @@ class TestQuizManager(unittest.TestCase):
             self.assertEqual(len(wrong_options), 3)
             
             # 正解が含まれていないか
-            pattern = QUESTION_PATTERNS[q_type]
-            correct_answer = test_poem[pattern['correct_field']]
+            correct_answer = test_poem[_CORRECT_FIELDS[q_type]]
             self.assertNotIn(correct_answer, wrong_options)
             
-        print("✓ 不正解選択肢の生成成功")
+        log("✓ 不正解選択肢の生成成功")
     
-    def test_sequential_mode(self):
-        """順番モードのテスト"""
-        config = QuizConfig(
-            quiz_mode=QuizMode.SEQUENTIAL,
-            question_types=[QuestionType.LOWER_MATCH.value],
-            max_questions=10
+    def test_wrong_options_exceeding_pool(self):
+        """候補数を超える不正解選択肢を要求した場合のテスト"""
+        test_poem = self.loader.get_poem_by_id(50)
+        
+        # 候補を全て返し、正解も重複も含まないか
+        wrong_options = self.manager.get_wrong_options(
+            test_poem, _Q_AUTHOR, 200
         )
+        self.assertEqual(len(wrong_options), len(set(wrong_options)))
+        self.assertNotIn(test_poem['author'], wrong_options)
+        self.assertEqual(len(wrong_options), len(self.loader.get_authors()) - 1)
         
-        session = self.manager.create_quiz_session(config)
+        log(f"✓ 候補数を超える要求の処理正常: {len(wrong_options)}件")
+    
+    def test_quiz_modes(self):
+        """出題モード（順番・ランダム）のテスト"""
+        expected_ids = list(range(1, 11))
         
-        # 10問生成
-        poem_ids = []
-        for _ in range(10):
-            question = self.manager.generate_next_question(session)
-            if question:
-                poem_ids.append(question.poem_id)
+        for mode in (QuizMode.SEQUENTIAL, QuizMode.RANDOM):
+            with self.subTest(mode=mode):
+                config = QuizConfig(
+                    quiz_mode=mode,
+                    question_types=[_Q_LOWER],
+                    max_questions=10
+                )
+                session = self.manager.create_quiz_session(config)
+                
+                # 10問生成
+                for _ in range(10):
+                    self.manager.generate_next_question(session)
+                poem_ids = np.fromiter((q.poem_id for q in session.questions),
+                                       dtype=np.int16, count=len(session.questions))
+                
+                # 使用済みIDが出題順と集合の両方で記録されているか
+                self.assertEqual(list(session.used_poem_ids), poem_ids.tolist())
+                self.assertEqual(session.get_used_poem_id_set(), set(session.used_poem_ids))
+                
+                if mode is QuizMode.SEQUENTIAL:
+                    # 順番通りか確認
+                    self.assertTrue(np.array_equal(poem_ids, np.arange(1, 11)),
+                                    f"順番モードで歌IDが順番通りではありません: {poem_ids.tolist()}")
+                    log(f"✓ 順番モード正常: {poem_ids.tolist()}")
+                    continue
+                
+                # 事前生成分を使い切った後も重複なく生成できるか
+                self.manager.generate_next_question(session)
+                self.assertEqual(len(session.questions), 11)
+                poem_ids = np.fromiter((q.poem_id for q in session.questions),
+                                       dtype=np.int16, count=len(session.questions))
+                
+                # 重複がないか確認
+                self.assertEqual(np.unique(poem_ids).size, poem_ids.size,
+                                f"ランダムモードで重複があります: {poem_ids.tolist()}")
+                
+                # 完全に順番通りでないことを確認（偶然の一致を考慮）
+                if poem_ids[:10].tolist() == expected_ids:
+                    log("⚠ ランダムモードが偶然順番通りになりました（稀）")
+                else:
+                    log(f"✓ ランダムモード正常: {poem_ids.tolist()}")
+    
+    def test_sequential_lazy_advances(self):
+        """事前生成なしの順番モードで、同じ歌を重ねて使用済みにしても先に進むかのテスト"""
+        session = QuizSession(quiz_mode=QuizMode.SEQUENTIAL, max_questions=5)
+        session.mark_poem_used(1)
+        session.mark_poem_used(1)
         
-        # 順番通りか確認
-        expected_ids = list(range(1, 11))
-        self.assertEqual(poem_ids, expected_ids,
-                        f"順番モードで歌IDが順番通りではありません: {poem_ids}")
+        poem_ids = [self.manager.generate_next_question(session).poem_id for _ in range(4)]
+        self.assertEqual(len(set(poem_ids)), 4, f"同じ歌が繰り返し出題されています: {poem_ids}")
         
-        print(f"✓ 順番モード正常: {poem_ids}")
+        log(f"✓ 事前生成なしの順番モード正常: {poem_ids}")
     
-    def test_random_mode(self):
-        """ランダムモードのテスト"""
+    def test_used_poem_is_skipped(self):
+        """出題前に使用済みになった歌が、事前生成の有無にかかわらず同じ規則で飛ばされるかのテスト"""
         config = QuizConfig(
-            quiz_mode=QuizMode.RANDOM,
-            question_types=[QuestionType.LOWER_MATCH.value],
-            max_questions=10
+            quiz_mode=QuizMode.SEQUENTIAL,
+            question_types=[_Q_LOWER],
+            max_questions=5
         )
+        sessions = {
+            "事前生成あり": self.manager.create_quiz_session(config),
+            "事前生成なし": QuizSession(quiz_mode=QuizMode.SEQUENTIAL, max_questions=5),
+        }
         
-        session = self.manager.create_quiz_session(config)
-        
-        # 10問生成
-        poem_ids = []
-        for _ in range(10):
-            question = self.manager.generate_next_question(session)
-            if question:
-                poem_ids.append(question.poem_id)
-        
-        # 重複がないか確認
-        self.assertEqual(len(poem_ids), len(set(poem_ids)),
-                        f"ランダムモードで重複があります: {poem_ids}")
-        
-        # 完全に順番通りでないことを確認（偶然の一致を考慮）
-        sequential = list(range(1, 11))
-        if poem_ids == sequential:
-            print("⚠ ランダムモードが偶然順番通りになりました（稀）")
-        else:
-            print(f"✓ ランダムモード正常: {poem_ids}")
+        for name, session in sessions.items():
+            with self.subTest(session=name):
+                session.mark_poem_used(2)
+                poem_ids = [self.manager.generate_next_question(session).poem_id for _ in range(4)]
+                self.assertEqual(poem_ids, [1, 3, 4, 5])
+                log(f"✓ {name}: 使用済みの歌を除いて出題 {poem_ids}")
     
     def test_session_management(self):
         """セッション管理のテスト"""
         config = QuizConfig(
             quiz_mode=QuizMode.SEQUENTIAL,
-            question_types=[QuestionType.LOWER_MATCH.value],
+            question_types=[_Q_LOWER],
             max_questions=5
         )
         
@@ -197,7 +248,66 @@ class TestQuizManager(unittest.TestCase):
         self.assertEqual(session.score, 1)
         self.assertEqual(session.total_answered, 1)
         
-        print("✓ セッション管理正常")
+        # 統計情報が回答に合わせて更新されているか
+        stats = session.get_statistics()
+        self.assertEqual(stats['answered'], 1)
+        self.assertEqual(stats['correct'], 1)
+        self.assertEqual(stats['total_questions'], 1)
+        self.assertEqual(stats['remaining'], 4)
+        self.assertEqual(stats['accuracy'], 100.0)
+        
+        # 取得した統計情報を書き換えてもセッション側は変わらないか
+        stats['correct'] = 0
+        self.assertEqual(session.get_statistics()['correct'], 1)
+        self.assertEqual(session.get_score_text(), "スコア: 1/1 (100.0%)")
+        
+        # 次の問題に進むと進捗が更新されるか
+        self.assertEqual(session.get_progress(), "1/5")
+        self.manager.generate_next_question(session)
+        self.assertTrue(session.next_question())
+        self.assertEqual(session.get_progress(), "2/5")
+        self.assertFalse(session.is_answered)
+        
+        log("✓ セッション管理正常")
+    
+    def test_question_statistics(self):
+        """問題タイプ別統計のテスト"""
+        config = QuizConfig(
+            quiz_mode=QuizMode.SEQUENTIAL,
+            question_types=[_Q_LOWER, _Q_AUTHOR],
+            max_questions=10
+        )
+        session = self.manager.create_quiz_session(config)
+        for _ in range(10):
+            self.manager.generate_next_question(session)
+        
+        stats = self.manager.get_question_statistics(session)
+        self.assertEqual(stats['total'], 10)
+        self.assertEqual(sum(stats['by_type'].values()), 10)
+        for q_type, count in stats['by_type'].items():
+            self.assertEqual(stats['correct_by_type'][q_type]['total'], count)
+            self.assertEqual(stats['correct_by_type'][q_type]['correct'], 0)  # 未回答
+        
+        log(f"✓ 問題タイプ別統計正常: {stats['by_type']}")
+    
+    def test_config_round_trip(self):
+        """クイズ設定の辞書変換テスト"""
+        config = QuizConfig(
+            quiz_mode=QuizMode.RANDOM,
+            question_types=[_Q_UPPER],
+            max_questions=20,
+            time_limit=30
+        )
+        data = config.to_dict()
+        data['unknown_key'] = 'ignored'  # 未知の項目は無視される
+        
+        self.assertEqual(QuizConfig.from_dict(data), config)
+        self.assertEqual(QuizConfig.from_dict({}), QuizConfig())
+        
+        # JSONのバイト列を経由しても同じ設定に戻るか
+        self.assertEqual(QuizConfig.from_json_bytes(config.to_json_bytes()), config)
+        
+        log("✓ クイズ設定の辞書変換正常")
     
     def test_edge_cases(self):
         """エッジケースのテスト"""
@@ -208,16 +318,37 @@ class TestQuizManager(unittest.TestCase):
             self.manager.generate_question(test_poem, "invalid_type")
         
         # 存在しない歌ID
-        session = QuizSession()
-        session.used_poem_ids = list(range(1, 101))  # 全て使用済み
+        session = QuizSession(quiz_mode=QuizMode.RANDOM)
+        for poem_id in _ALL_POEM_IDS:  # 全て使用済み
+            session.mark_poem_used(poem_id)
         next_poem = self.manager.get_next_poem(
             QuizMode.RANDOM,
             100,
-            session.used_poem_ids
+            session.get_used_poem_id_set()
         )
         self.assertIsNone(next_poem)
+        self.assertIsNone(self.manager.generate_next_question(session))
+        
+        # 使用済み歌IDは直接書き換えられない（集合と食い違わないように）
+        with self.assertRaises(AttributeError):
+            session.used_poem_ids = list(_ALL_POEM_IDS)
+        
+        log("✓ エッジケースの処理正常")
+    
+    def test_explanation(self):
+        """解説文生成のテスト"""
+        test_poem = self.loader.get_poem_by_id(1)
+        question = self.lower_questions[test_poem['id'] - 1]
+        
+        explanation = question.get_explanation()
+        self.assertIn(f"【第{test_poem['id']}首】", explanation)
+        self.assertIn(test_poem['upper'], explanation)
+        self.assertIn(test_poem['lower'], explanation)
+        
+        # 2回目以降は同じ解説文を返す
+        self.assertIs(question.get_explanation(), explanation)
         
-        print("✓ エッジケースの処理正常")
+        log("✓ 解説文生成正常")
     
     def test_question_text_formatting(self):
         """問題文のフォーマットテスト"""
@@ -230,17 +361,33 @@ class TestQuizManager(unittest.TestCase):
             self.assertTrue(len(question.question_text) > 0)
             
             # 問題文に歌の内容が含まれているか確認
-            if q_type == QuestionType.LOWER_MATCH.value:
+            if q_type == _Q_LOWER:
                 self.assertIn(test_poem['upper'], question.question_text)
-            elif q_type == QuestionType.UPPER_MATCH.value:
+            elif q_type == _Q_UPPER:
                 self.assertIn(test_poem['lower'], question.question_text)
-            elif q_type == QuestionType.AUTHOR_MATCH.value:
+            elif q_type == _Q_AUTHOR:
                 self.assertIn(test_poem['upper'], question.question_text)
                 self.assertIn(test_poem['lower'], question.question_text)
-            elif q_type == QuestionType.POEM_BY_AUTHOR.value:
+            elif q_type == _Q_POEM_BY_AUTHOR:
                 self.assertIn(test_poem['author'], question.question_text)
         
-        print("✓ 問題文フォーマット正常")
+        log("✓ 問題文フォーマット正常")
+    
+    def test_question_formatter_matches_template(self):
+        """問題文生成関数がテンプレートと同じ問題文を返すかのテスト"""
+        for poem in self.loader.get_all_poems():
+            for q_type, pattern in QUESTION_PATTERNS.items():
+                expected = pattern['question'].format(
+                    upper=poem['upper'], lower=poem['lower'], author=poem['author']
+                )
+                self.assertEqual(pattern['formatter'](poem), expected)
+        
+        log("✓ 問題文生成関数とテンプレートが一致")
+
+
+# テストメソッド名（実行のたびにクラスを走査しないよう事前に収集）
+# TestSuiteは実行後にテストを破棄するため、スイート自体ではなくメソッド名を保持する
+_TEST_NAMES = tuple(unittest.TestLoader().getTestCaseNames(TestQuizManager))
 
 
 def run_tests():
@@ -250,10 +397,14 @@ def run_tests():
     print("=" * 50)
     
     # テストスイートの作成
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestQuizManager)
+    suite = unittest.TestSuite(map(TestQuizManager, _TEST_NAMES))
+    worker_count = os.cpu_count() or 1
+    if ConcurrentTestSuite is not None and worker_count > 1:
+        suite = ConcurrentTestSuite(suite, fork_for_tests(worker_count))
     
     # テストの実行
-    runner = unittest.TextTestRunner(verbosity=2)
+    # 経過表示を有効にしていない場合、成功したテストの出力は表示しない
+    runner = unittest.TextTestRunner(verbosity=2, buffer=not VERBOSE)
     result = runner.run(suite)
     
     print("\n" + "=" * 50)
@@ -0,0 +1,54 @@
+"""
+百人一首データのPythonモジュール生成スクリプト
+
+data/hyakunin_isshu.json を読み込んで検証し、歌データをPythonのリテラルとして
+modules/poems_data.py に書き出す。JSONを更新したら再実行すること。
+
+使い方:
+    python tools/gen_poems.py
+"""
+import sys
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from modules.data_loader import DataLoader, DEFAULT_JSON_PATH
+from modules.models import Poem
+
+OUTPUT_PATH = ROOT / "modules" / "poems_data.py"
+
+HEADER = '''"""
+百人一首データ（自動生成）
+
+tools/gen_poems.py により {source} から生成。直接編集しないこと。
+"""
+from modules.models import Poem
+
+
+POEMS = (
+'''
+
+
+def format_poem(poem: Poem) -> str:
+    """歌データを1件分のPythonリテラルに変換する"""
+    fields = ", ".join(f"{name}={getattr(poem, name)!r}" for name in Poem._fields)
+    return f"    Poem({fields}),\n"
+
+
+def main() -> None:
+    """JSONを検証してモジュールを書き出す"""
+    # 生成済みモジュールではなく、必ずJSONから読み込んで検証する
+    loader = DataLoader(str(ROOT / DEFAULT_JSON_PATH), use_prebuilt=False)
+
+    lines = [HEADER.format(source=DEFAULT_JSON_PATH)]
+    lines.extend(format_poem(poem) for poem in loader.get_all_poems())
+    lines.append(")\n")
+
+    OUTPUT_PATH.write_text("".join(lines), encoding="utf-8")
+    print(f"✓ {OUTPUT_PATH.relative_to(ROOT)} を生成しました（{loader.get_poem_count()}首）")
+
+
+if __name__ == "__main__":
+    main()